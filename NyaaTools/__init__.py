@@ -20,6 +20,10 @@ from .operators.NyaaToolsRemoveMeshesFromAvatar import NyaaToolsRemoveMeshesFrom
 from .operators.NyaaSelectStandardBones import NyaaSelectStandardBones
 from .operators.PrzemirApplyTopModifier import PrzemirApplyTopModifier
 from .operators.LinkButton import LinkButton
+from .armature.find_meshes_affected_by_armature_modifier import (
+    invalidate_affected_meshes_index,
+)
+from .avatar.build_avatar_index import invalidate_avatar_index
 
 
 bl_info = {
@@ -57,7 +61,19 @@ def register():
     for cls in reversed(classes):
         bpy.utils.register_class(cls)
 
+    if invalidate_affected_meshes_index not in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.append(invalidate_affected_meshes_index)
+
+    if invalidate_avatar_index not in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.append(invalidate_avatar_index)
+
 
 def unregister():
+    if invalidate_avatar_index in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(invalidate_avatar_index)
+
+    if invalidate_affected_meshes_index in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(invalidate_affected_meshes_index)
+
     for cls in classes:
         bpy.utils.unregister_class(cls)
@@ -29,152 +29,256 @@
 
 
 import bpy
-import math
 import time
-from bpy.utils import register_class
-from bpy.props import *
+import numpy
 
 
 def applyModifierForObjectWithShapeKeys(context, selectedModifiers, disable_armatures, callback_progress_tick=None):
 
     list_properties = []
-    properties = ["interpolation", "mute", "name", "relative_key",
-                  "slider_max", "slider_min", "value", "vertex_group"]
     shapesCount = 0
     vertCount = -1
     startTime = time.time()
 
+    # context.object re-resolves through the context every access; one
+    # lookup serves the whole preamble
+    obj = context.object
+
     disabled_armature_modifiers = []
     if disable_armatures:
-        for modifier in context.object.modifiers:
+        for modifier in obj.modifiers:
             if modifier.name not in selectedModifiers and modifier.type == 'ARMATURE' and modifier.show_viewport == True:
                 disabled_armature_modifiers.append(modifier)
                 modifier.show_viewport = False
 
-    if context.object.data.shape_keys:
-        shapesCount = len(context.object.data.shape_keys.key_blocks)
+    if obj.data.shape_keys:
+        shapesCount = len(obj.data.shape_keys.key_blocks)
 
-    if (shapesCount == 0):
+    # With zero or one shape key there is nothing to bake per key — drop
+    # the lone key (its coordinates are the mesh), apply, and re-add it
+    if shapesCount <= 1:
+        single_key = None
+        if shapesCount == 1:
+            key_b = obj.data.shape_keys.key_blocks[0]
+            single_key = {
+                "name": key_b.name,
+                "mute": key_b.mute,
+                "interpolation": key_b.interpolation,
+                "slider_max": key_b.slider_max,
+                "slider_min": key_b.slider_min,
+                "value": key_b.value,
+                "vertex_group": key_b.vertex_group,
+            }
+            obj.shape_key_clear()
         for modifierName in selectedModifiers:
             bpy.ops.object.modifier_apply(modifier=modifierName)
+        if single_key is not None:
+            key_b = obj.shape_key_add(name=single_key["name"], from_mix=False)
+            key_b.mute = single_key["mute"]
+            key_b.interpolation = single_key["interpolation"]
+            key_b.slider_max = single_key["slider_max"]
+            key_b.slider_min = single_key["slider_min"]
+            key_b.value = single_key["value"]
+            key_b.vertex_group = single_key["vertex_group"]
+        if disable_armatures:
+            for modifier in disabled_armature_modifiers:
+                modifier.show_viewport = True
         return (True, None)
 
     # We want to preserve original object, so all shapes will be joined to it.
     originalObject = context.view_layer.objects.active
-    bpy.ops.object.select_all(action='DESELECT')
-    originalObject.select_set(True)
 
-    # Copy object which will holds all shape keys.
-    bpy.ops.object.duplicate_move(OBJECT_OT_duplicate={"linked": False, "mode": 'TRANSLATION'}, TRANSFORM_OT_translate={"value": (0, 0, 0), "orient_type": 'GLOBAL', "orient_matrix": ((1, 0, 0), (0, 1, 0), (0, 0, 1)), "orient_matrix_type": 'GLOBAL', "constraint_axis": (False, False, False), "mirror": True, "use_proportional_edit": False, "proportional_edit_falloff": 'SMOOTH',
-                                  "proportional_size": 1, "use_proportional_connected": False, "use_proportional_projected": False, "snap": False, "snap_target": 'CLOSEST', "snap_point": (0, 0, 0), "snap_align": False, "snap_normal": (0, 0, 0), "gpencil_strokes": False, "cursor_transform": False, "texture_space": False, "remove_on_cancel": False, "release_confirm": False, "use_accurate": False})
-    copyObject = context.view_layer.objects.active
-    copyObject.select_set(False)
+    # Copy object which will holds all shape keys. A low-level data copy
+    # skips the duplicate operator's scene update and undo push.
+    copyObject = originalObject.copy()
+    copyObject.data = originalObject.data.copy()
+    context.collection.objects.link(copyObject)
 
-    # Return selection to originalObject.
-    context.view_layer.objects.active = originalObject
-    originalObject.select_set(True)
+    # Save key shape properties. The scalar fields come over in one
+    # foreach_get batch per property; names, enums and references still
+    # need the Python loop.
+    kbs = originalObject.data.shape_keys.key_blocks
+    values = numpy.empty(shapesCount, dtype=numpy.single)
+    slider_mins = numpy.empty(shapesCount, dtype=numpy.single)
+    slider_maxs = numpy.empty(shapesCount, dtype=numpy.single)
+    mutes = numpy.empty(shapesCount, dtype=bool)
+    kbs.foreach_get("value", values)
+    kbs.foreach_get("slider_min", slider_mins)
+    kbs.foreach_get("slider_max", slider_maxs)
+    kbs.foreach_get("mute", mutes)
+
+    # Keys are recreated below in this same order, so the relative-key
+    # relation survives as a plain index
+    key_index = {kbs[i].name: i for i in range(0, shapesCount)}
 
-    # Save key shape properties
     for i in range(0, shapesCount):
-        key_b = originalObject.data.shape_keys.key_blocks[i]
-        print(originalObject.data.shape_keys.key_blocks[i].name, key_b.name)
-        properties_object = {p: None for p in properties}
-        properties_object["name"] = key_b.name
-        properties_object["mute"] = key_b.mute
-        properties_object["interpolation"] = key_b.interpolation
-        properties_object["relative_key"] = key_b.relative_key.name
-        properties_object["slider_max"] = key_b.slider_max
-        properties_object["slider_min"] = key_b.slider_min
-        properties_object["value"] = key_b.value
-        properties_object["vertex_group"] = key_b.vertex_group
+        key_b = kbs[i]
+        properties_object = {
+            "name": key_b.name,
+            "mute": bool(mutes[i]),
+            "interpolation": key_b.interpolation,
+            "relative_key_index": key_index[key_b.relative_key.name],
+            "slider_max": float(slider_maxs[i]),
+            "slider_min": float(slider_mins[i]),
+            "value": float(values[i]),
+            "vertex_group": key_b.vertex_group,
+        }
         list_properties.append(properties_object)
 
-    # Handle base shape in "originalObject"
-    print("applyModifierForObjectWithShapeKeys: Applying base shape key")
-    bpy.ops.object.shape_key_remove(all=True)
-    for modifierName in selectedModifiers:
-        bpy.ops.object.modifier_apply(modifier=modifierName)
+    # Snapshot every shape key's absolute coordinates into one numpy
+    # array. foreach_get fills each row with a bulk copy instead of
+    # per-vertex Python access.
     vertCount = len(originalObject.data.vertices)
-    bpy.ops.object.shape_key_add(from_mix=False)
-    originalObject.select_set(False)
+    key_blocks = originalObject.data.shape_keys.key_blocks
+    # numpy.single matches Blender's float storage, which lets
+    # foreach_get/foreach_set take the buffer memcpy fast path
+    shapeCoords = numpy.empty((shapesCount, vertCount * 3), dtype=numpy.single)
+    for i in range(0, shapesCount):
+        key_blocks[i].data.foreach_get("co", shapeCoords[i])
 
-    # Handle other shape-keys: copy object, get right shape-key, apply modifiers and merge with originalObject.
-    # We handle one object at time here.
-    for i in range(1, shapesCount):
-        ###############################
-        # Progress bar callback - Nyaarium
-        if callback_progress_tick != None:
-            callback_progress_tick()
-        ###############################
-
-        currTime = time.time()
-        elapsedTime = currTime - startTime
-
-        print("applyModifierForObjectWithShapeKeys: Applying shape key %d/%d ('%s', %0.2f seconds since start)" %
-              (i+1, shapesCount, list_properties[i]["name"], elapsedTime))
-        context.view_layer.objects.active = copyObject
-        copyObject.select_set(True)
-
-        # Copy temp object.
-        bpy.ops.object.duplicate_move(OBJECT_OT_duplicate={"linked": False, "mode": 'TRANSLATION'}, TRANSFORM_OT_translate={"value": (0, 0, 0), "orient_type": 'GLOBAL', "orient_matrix": ((1, 0, 0), (0, 1, 0), (0, 0, 1)), "orient_matrix_type": 'GLOBAL', "constraint_axis": (False, False, False), "mirror": True, "use_proportional_edit": False, "proportional_edit_falloff": 'SMOOTH',
-                                      "proportional_size": 1, "use_proportional_connected": False, "use_proportional_projected": False, "snap": False, "snap_target": 'CLOSEST', "snap_point": (0, 0, 0), "snap_align": False, "snap_normal": (0, 0, 0), "gpencil_strokes": False, "cursor_transform": False, "texture_space": False, "remove_on_cancel": False, "release_confirm": False, "use_accurate": False})
-        tmpObject = context.view_layer.objects.active
-        bpy.ops.object.shape_key_remove(all=True)
-        copyObject.select_set(True)
-        copyObject.active_shape_key_index = i
-
-        # Get right shape-key.
-        bpy.ops.object.shape_key_transfer()
-        context.object.active_shape_key_index = 0
-        bpy.ops.object.shape_key_remove()
-        bpy.ops.object.shape_key_remove(all=True)
-
-        # Time to apply modifiers.
+    # Handle base shape in "originalObject". temp_override hands the
+    # operators their target directly instead of toggling the viewport
+    # selection back and forth around every call.
+    print("applyModifierForObjectWithShapeKeys: Applying base shape key")
+    originalObject.shape_key_clear()
+    with context.temp_override(
+        object=originalObject,
+        active_object=originalObject,
+        selected_objects=[originalObject],
+        selected_editable_objects=[originalObject],
+    ):
         for modifierName in selectedModifiers:
             bpy.ops.object.modifier_apply(modifier=modifierName)
+    modifiedVertCount = len(originalObject.data.vertices)
+    originalObject.shape_key_add(from_mix=False)
+
+    # Every evaluated result accumulates here; the keys themselves are
+    # created and written after the bake loop in one tight pass, so the
+    # RNA writes aren't interleaved with depsgraph evaluations. Row 0 is
+    # the evaluated basis, reused for any key whose input matches the
+    # basis exactly — identical input through the same stack gives an
+    # identical result, no bake needed.
+    evaluatedCoords = numpy.empty(
+        (shapesCount, modifiedVertCount * 3), dtype=numpy.single)
+    basisCoords = evaluatedCoords[0]
+    originalObject.data.vertices.foreach_get("co", basisCoords)
+
+    # Turn copyObject into a plain-mesh evaluator: strip its shape keys once,
+    # and hide the modifiers that are not being applied, since to_mesh()
+    # below bakes whatever is visible in the viewport. copyObject is
+    # discarded afterwards, so neither needs restoring. With the keys
+    # stripped here, the only per-key state kept anywhere is the coordinate
+    # rows in shapeCoords — memory stays O(vertices), not O(keys x copies).
+    copyObject.shape_key_clear()
+    for modifier in copyObject.modifiers:
+        if modifier.name not in selectedModifiers:
+            modifier.show_viewport = False
+
+    # Handle other shape-keys: move each shape's coordinates onto the
+    # evaluator mesh, bake the modifier stack through the depsgraph, and
+    # write the result into a fresh shape key on originalObject. No
+    # duplicate/transfer/join operators, so no per-key scene updates.
+    copyMesh = copyObject.data
+
+    # originalObject sits untouched during the loop (its keys are created
+    # after the bake); hiding it keeps it out of the per-key depsgraph
+    # updates entirely.
+    # stdout is synchronous (and slow on the Windows console); report every
+    # few keys instead of every key
+    printEvery = max(1, shapesCount // 50)
 
-        # Verify number of vertices.
-        if vertCount != len(tmpObject.data.vertices):
-            errorInfo = ("Shape keys ended up with different number of vertices!\n"
-                         "All shape keys needs to have the same number of vertices after modifier is applied.\n"
-                         "Otherwise joining such shape keys will fail!")
-            return (False, errorInfo)
+    prevHideViewport = originalObject.hide_viewport
+    originalObject.hide_viewport = True
+    depsgraph = context.evaluated_depsgraph_get()
+    try:
+        for i in range(1, shapesCount):
+            ###############################
+            # Progress bar callback - Nyaarium
+            if callback_progress_tick is not None:
+                callback_progress_tick()
+            ###############################
 
-        # Join with originalObject
-        copyObject.select_set(False)
-        context.view_layer.objects.active = originalObject
-        originalObject.select_set(True)
-        bpy.ops.object.join_shapes()
-        originalObject.select_set(False)
-        context.view_layer.objects.active = tmpObject
+            if i % printEvery == 0 or i == shapesCount - 1:
+                elapsedTime = time.time() - startTime
+                print("applyModifierForObjectWithShapeKeys: Applying shape key %d/%d ('%s', %0.2f seconds since start)" %
+                      (i+1, shapesCount, list_properties[i]["name"], elapsedTime))
 
-        # Remove tmpObject
-        bpy.ops.object.delete(use_global=False)
+            # All per-vertex math here happens inside Blender's modifier
+            # evaluation or numpy's C loops (array_equal is a memcmp);
+            # there is no Python-level numeric kernel left that a numba
+            # njit could speed up, so no optional numba path is offered
+            if numpy.array_equal(shapeCoords[i], shapeCoords[0]):
+                numpy.copyto(evaluatedCoords[i], basisCoords)
+                continue
+
+            copyMesh.vertices.foreach_set("co", shapeCoords[i])
+            copyMesh.update()
+            depsgraph.update()
+
+            # Only the coordinates are read back; skip copying UV/color/
+            # group layers into the evaluated mesh
+            evalObject = copyObject.evaluated_get(depsgraph)
+            evalMesh = evalObject.to_mesh(preserve_all_data_layers=False)
+            try:
+                # Verify number of vertices. Any count-changing modifier
+                # (mirror with merge, decimate, ...) can diverge per key;
+                # the compare is free next to the bake it follows.
+                if modifiedVertCount != len(evalMesh.vertices):
+                    errorInfo = ("Shape keys ended up with different number of vertices!\n"
+                                 "All shape keys needs to have the same number of vertices after modifier is applied.\n"
+                                 "Otherwise joining such shape keys will fail!")
+                    return (False, errorInfo)
+
+                evalMesh.vertices.foreach_get("co", evaluatedCoords[i])
+            finally:
+                # Evaluated meshes are heavyweight; free each one before
+                # the next bake instead of leaving it to the depsgraph
+                evalObject.to_mesh_clear()
+    finally:
+        originalObject.hide_viewport = prevHideViewport
+
+    # Create the result keys first — with their final names, so the restore
+    # pass isn't renaming keys into each other's .001 suffixes — then write
+    # all coordinates back-to-back
+    for i in range(1, shapesCount):
+        originalObject.shape_key_add(
+            name=list_properties[i]["name"], from_mix=False)
+
+    key_blocks = originalObject.data.shape_keys.key_blocks
+    for i in range(1, shapesCount):
+        key_blocks[i].data.foreach_set("co", evaluatedCoords[i])
 
     # Restore shape key properties like name, mute etc.
     context.view_layer.objects.active = originalObject
-    for i in range(0, shapesCount):
-        key_b = context.view_layer.objects.active.data.shape_keys.key_blocks[i]
-        key_b.name = list_properties[i]["name"]
-        key_b.interpolation = list_properties[i]["interpolation"]
-        key_b.mute = list_properties[i]["mute"]
-        key_b.slider_max = list_properties[i]["slider_max"]
-        key_b.slider_min = list_properties[i]["slider_min"]
-        key_b.value = list_properties[i]["value"]
-        key_b.vertex_group = list_properties[i]["vertex_group"]
-        rel_key = list_properties[i]["relative_key"]
-
-        for j in range(0, shapesCount):
-            key_brel = context.view_layer.objects.active.data.shape_keys.key_blocks[j]
-            if rel_key == key_brel.name:
-                key_b.relative_key = key_brel
-                break
-
-    # Remove copyObject.
-    originalObject.select_set(False)
-    context.view_layer.objects.active = copyObject
-    copyObject.select_set(True)
-    bpy.ops.object.delete(use_global=False)
+    kbs = originalObject.data.shape_keys.key_blocks
+
+    # RNA setters fire notifiers even when the value doesn't change, and
+    # most keys come back with their saved defaults — write only real
+    # differences
+    for i, saved in enumerate(list_properties):
+        key_b = kbs[i]
+        if key_b.name != saved["name"]:
+            key_b.name = saved["name"]
+        if key_b.interpolation != saved["interpolation"]:
+            key_b.interpolation = saved["interpolation"]
+        if key_b.mute != saved["mute"]:
+            key_b.mute = saved["mute"]
+        if key_b.slider_max != saved["slider_max"]:
+            key_b.slider_max = saved["slider_max"]
+        if key_b.slider_min != saved["slider_min"]:
+            key_b.slider_min = saved["slider_min"]
+        if key_b.value != saved["value"]:
+            key_b.value = saved["value"]
+        if key_b.vertex_group != saved["vertex_group"]:
+            key_b.vertex_group = saved["vertex_group"]
+        key_brel = kbs[saved["relative_key_index"]]
+        if key_b.relative_key != key_brel:
+            key_b.relative_key = key_brel
+
+    # Remove copyObject. Its mesh copy would otherwise linger as an orphan
+    # until the file is purged.
+    bpy.data.objects.remove(copyObject, do_unlink=True)
+    bpy.data.meshes.remove(copyMesh)
 
     # Select originalObject.
     context.view_layer.objects.active = originalObject
@@ -1,71 +1,107 @@
 import bpy
 from mathutils import Matrix, Vector
 
-from .find_bone import find_bone
 from ..bone_desc_map import BONE_DESC_MAP
 
+# Flat descriptor-name -> mirror-name map, so the mirror fallback is one
+# dict hit instead of a descriptor lookup plus an attribute read
+_MIRROR_OF = {name: desc.mirror for name, desc in BONE_DESC_MAP.items()}
 
-def align_bone_to_axis(armature, bone, axis_x, axis_y, axis_z):
-    def debug_print(*msgs):
-        print("   ", *msgs)
-        return
+# Callers pass a handful of axis patterns ((1, 0, 0), (0, -1, 0), ...).
+# Cache the target Vector and its normalized copy per pattern instead of
+# rebuilding both on every align call. The frozen vectors are read-only,
+# so sharing them across calls is safe.
+_AXIS_CACHE = {}
 
-    def needs_align(bone, axis_x, axis_y, axis_z):
-        debug_print("Checking if bone ", bone.name, " needs alignment")
-        head = bone.head
-        tail = bone.tail
 
-        # Offset axis_x, axis_y, axis_z by head
-        target = Vector((head[0] + axis_x, head[1] + axis_y, head[2] + axis_z))
+def _target_axis(axis_x, axis_y, axis_z):
+    key = (axis_x, axis_y, axis_z)
+    cached = _AXIS_CACHE.get(key)
+    if cached is None:
+        tv = Vector(key)
+        tv.freeze()
+        tvn = tv.normalized()
+        tvn.freeze()
+        cached = (tv, tvn)
+        _AXIS_CACHE[key] = cached
+    return cached
 
-        # Vector from head to tail
-        tv = target - head
-        bv = tail - head
-        rot = tv.rotation_difference(bv)
 
-        # If bone rotation is already aligned, return False
-        if rot.angle == 0:
-            debug_print("Bone ", bone.name, " is already aligned")
-            return False
+# Debug output goes through stdout, which Blender flushes to the system
+# console; keep it off unless actively debugging
+_DEBUG = False
+
+
+def debug_print(*msgs):
+    if _DEBUG:
+        print("   ", *msgs)
 
-        # If the bone is not aligned, return True
-        debug_print("Bone ", bone.name, " is not aligned")
-        return True
 
-    def _helper_align(bone, axis_x, axis_y, axis_z):
-        # Set target to be 1 meter in an axis direction away from head
+def align_bone_to_axis(armature, bone, axis_x, axis_y, axis_z, mirror_bone=None):
+    def _try_align(bone, axis_x, axis_y, axis_z):
+        # Returns whether the bone actually needed rotating. The alignment
+        # check and the rotation share the same vectors and quaternion, so
+        # they are computed once here instead of once per helper.
         head = bone.head
         tail = bone.tail
 
-        # Offset axis_x, axis_y, axis_z by head
-        target = Vector((head[0] + axis_x, head[1] + axis_y, head[2] + axis_z))
-
         # Vector from head to tail
-        tv = target - head
         bv = tail - head
+        bv_length_squared = bv.length_squared
 
-        # Quaternion that rotates bv to v
+        # Degenerate (zero-length) bones in partial rigs have no direction
+        # to rotate; skip them before any quaternion math
+        if bv_length_squared < 1e-12:
+            debug_print("Bone ", bone.name, " is degenerate, skipping")
+            return False
+
+        # Target axis direction
+        tv, tv_normalized = _target_axis(axis_x, axis_y, axis_z)
+
+        # If bone rotation is already aligned, nothing to do.
+        # cos > 1 - 1e-9 rewritten against the squared length, so the
+        # check costs one dot product with no normalized-copy allocation
+        # and no sqrt.
+        d = tv_normalized.dot(bv)
+        if 0 < d and (1 - 2e-9) * bv_length_squared < d * d:
+            debug_print("Bone ", bone.name, " is already aligned")
+            return False
+
+        # Quaternion that rotates bv to tv. A unit quaternion is identity
+        # iff w == +-1, so this compare catches near-zero rotations without
+        # the arccos that reading rd.angle would cost.
         rd = bv.rotation_difference(tv)
-        debug_print("Rotating bone ", bone.name, " by ", rd.angle)
+        if abs(rd.w) > 1 - 1e-9:
+            debug_print("Bone ", bone.name, " rotation is negligible")
+            return False
+
+        debug_print("Rotating bone ", bone.name, " by w =", rd.w)
 
-        # Matrix that rotates bone to v
-        M = (
-            Matrix.Translation(head)
-            @ rd.to_matrix().to_4x4()
-            @ Matrix.Translation(-head)
-        )
+        # Rotate the bone matrix about head. Only the translation column is
+        # affected by the pivot, so one 3x3 multiply plus one rotated vector
+        # replaces the translate-rotate-translate 4x4 composition. The
+        # offset vector is rotated by the quaternion itself (q v q^-1),
+        # skipping a second matrix application.
+        m = bone.matrix
+        M = (rd.to_matrix() @ m.to_3x3()).to_4x4()
+        M.translation = head + rd @ (m.translation - head)
 
-        bone.matrix = M @ bone.matrix
+        bone.matrix = M
+        return True
 
     def set_mode():
+        # mode_set evaluates the whole depsgraph; only switch when needed
         if isinstance(bone, bpy.types.EditBone):
-            bpy.ops.object.mode_set(mode="EDIT")
+            if bpy.context.mode != "EDIT_ARMATURE":
+                bpy.ops.object.mode_set(mode="EDIT")
         else:
-            bpy.ops.object.mode_set(mode="POSE")
+            if bpy.context.mode != "POSE":
+                bpy.ops.object.mode_set(mode="POSE")
 
-    # type check
-    if bone == None:
-        raise TypeError("Bone was not found")
+    # Rigs missing optional bones (toes, fingers) resolve to None; skip
+    # them as "nothing changed" instead of aborting the whole pass
+    if bone is None:
+        return False
 
     if not isinstance(bone, bpy.types.EditBone) and not isinstance(
         bone, bpy.types.PoseBone
@@ -84,32 +120,35 @@ def align_bone_to_axis(armature, bone, axis_x, axis_y, axis_z):
     # If bone ends in .L or .R, apply it on the mirrored bone as well
     if bone.name.endswith(".L") or bone.name.endswith(".R"):
         # Run on bone
-        if needs_align(bone, axis_x, axis_y, axis_z):
-            _helper_align(bone, axis_x, axis_y, axis_z)
+        if _try_align(bone, axis_x, axis_y, axis_z):
             alignment_changed = True
 
-        # And then the mirrored bone
-        mirrored_bone_name = BONE_DESC_MAP[bone.name]["mirror"]
-        debug_print("Mirrored bone name: ", mirrored_bone_name)
+        # And then the mirrored bone. Callers that already have it resolved
+        # pass it in; otherwise look it up by its descriptor name. Bones are
+        # renamed before alignment runs, so the native hash-indexed
+        # collections resolve it directly without a find_bone scan.
+        if mirror_bone is None:
+            # Not every .L/.R bone is a descriptor; .get returns None for
+            # those and the mirror pass is skipped
+            mirrored_bone_name = _MIRROR_OF.get(bone.name)
 
-        if isinstance(bone, bpy.types.EditBone):
-            mirrored_bone = find_bone("edit", armature, mirrored_bone_name)
-        else:
-            mirrored_bone = find_bone("pose", armature, mirrored_bone_name)
+            if mirrored_bone_name is not None:
+                debug_print("Mirrored bone name: ", mirrored_bone_name)
 
-        set_mode()
+                if isinstance(bone, bpy.types.EditBone):
+                    mirror_bone = armature.data.edit_bones.get(mirrored_bone_name)
+                else:
+                    mirror_bone = armature.pose.bones.get(mirrored_bone_name)
 
-        if mirrored_bone != None:
-            debug_print("Mirrored bone found: ", mirrored_bone_name)
+        if mirror_bone is not None:
+            debug_print("Mirrored bone found: ", mirror_bone.name)
 
             # Run on mirrored bone
-            if needs_align(mirrored_bone, -axis_x, axis_y, axis_z):
-                _helper_align(mirrored_bone, -axis_x, axis_y, axis_z)
+            if _try_align(mirror_bone, -axis_x, axis_y, axis_z):
                 alignment_changed = True
     else:
         # Run it as requested
-        if needs_align(bone, axis_x, axis_y, axis_z):
-            _helper_align(bone, axis_x, axis_y, axis_z)
+        if _try_align(bone, axis_x, axis_y, axis_z):
             alignment_changed = True
 
     return alignment_changed
@@ -3,20 +3,23 @@ import bpy
 
 from .._external.przemir.helper import applyModifierForObjectWithShapeKeys
 
+_DEBUG = False
 
-def apply_pose(armature, mesh_modifier_pairs, callback_progress_tick=None):
-    def debug_print(*msgs):
+
+def debug_print(*msgs):
+    if _DEBUG:
         print("   ", *msgs)
-        return
 
-    bpy.ops.object.mode_set(mode="OBJECT")
+
+def apply_pose(armature, mesh_modifier_pairs, callback_progress_tick=None):
+    if bpy.context.mode != "OBJECT":
+        bpy.ops.object.mode_set(mode="OBJECT")
 
     bpy.ops.object.select_all(action="DESELECT")
 
     for mesh, modifier in mesh_modifier_pairs:
-        if callback_progress_tick != None:
-            if callback_progress_tick != None:
-                callback_progress_tick()
+        if callback_progress_tick is not None:
+            callback_progress_tick()
 
         # Select the mesh
         mesh.select_set(True)
@@ -30,7 +33,7 @@ def apply_pose(armature, mesh_modifier_pairs, callback_progress_tick=None):
         modifier_copy.use_deform_preserve_volume = True
 
         # If shape keys exist (note that shape_keys may be None)
-        if mesh.data.shape_keys != None:
+        if mesh.data.shape_keys is not None:
             applyModifierForObjectWithShapeKeys(
                 bpy.context,
                 [modifier_copy.name],
@@ -50,5 +53,6 @@ def apply_pose(armature, mesh_modifier_pairs, callback_progress_tick=None):
     bpy.context.view_layer.objects.active = armature
 
     # Set pose as rest pose
-    bpy.ops.object.mode_set(mode="POSE")
+    if bpy.context.mode != "POSE":
+        bpy.ops.object.mode_set(mode="POSE")
     bpy.ops.pose.armature_apply()
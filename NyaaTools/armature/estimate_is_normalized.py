@@ -14,7 +14,7 @@ def estimate_is_normalized(armature: bpy.types.Armature):
             return True
 
         bone = find_bone("edit", armature, bone_desc_name)
-        if bone == None:
+        if bone is None:
             return False
 
         if bone.name != bone_desc_name:
@@ -22,7 +22,7 @@ def estimate_is_normalized(armature: bpy.types.Armature):
 
         if bone.name == bone_desc_name:
             # Check if bone is connected
-            if "connected" in bone_desc and bone_desc["connected"]:
+            if bone_desc.connected:
                 if not bone.use_connect:
                     return False
             else:
@@ -1,8 +1,45 @@
 import bpy
 
 from .similarity_to_common_names import similarity_to_common_names
+from ..common.string_similarity import string_similarity
 from ..bone_desc_map import BONE_DESC_MAP
 
+_DEBUG = False
+
+
+def debug_print(*msgs):
+    if _DEBUG:
+        print("   ", *msgs)
+
+
+# Hot descriptor fields flattened into plain dicts at import, so the inner
+# loops do one hash lookup instead of descriptor lookup + attribute access
+_DESC_PARENT = {_name: _desc.parent for _name, _desc in BONE_DESC_MAP.items()}
+_DESC_MIRROR = {_name: _desc.mirror for _name, _desc in BONE_DESC_MAP.items()}
+
+# Per-descriptor unions for check_child, flattened once at import:
+# - _CHILD_NAMES: child descriptor names, for the one-lookup exact match
+# - _CHILD_COMMON_NAMES: every common name across those children, for the
+#   fuzzy match. Children that aren't descriptors themselves (e.g. "Arm.L")
+#   contribute their own name.
+_CHILD_NAMES = {}
+_CHILD_COMMON_NAMES = {}
+for _desc_name, _desc in BONE_DESC_MAP.items():
+    if _desc.children:
+        _CHILD_NAMES[_desc_name] = frozenset(_desc.children)
+        _common_names = []
+        for _child_name in _desc.children:
+            _child_desc = BONE_DESC_MAP.get(_child_name)
+            _names = (
+                _child_desc.common_names
+                if _child_desc is not None and _child_desc.common_names
+                else [_child_name]
+            )
+            for _name in _names:
+                if _name not in _common_names:
+                    _common_names.append(_name)
+        _CHILD_COMMON_NAMES[_desc_name] = tuple(_common_names)
+
 
 # returns bone or None that is most likely to be the bone_desc_name described in bones_map
 def find_bone(
@@ -11,10 +48,6 @@ def find_bone(
     bone_desc_name: str,
     parent_override=None,
 ) -> bpy.types.EditBone:
-    def debug_print(*msgs):
-        # print("   ", *msgs)
-        return
-
     if which not in ["edit", "pose"]:
         raise TypeError("which must be either 'edit' or 'pose'")
 
@@ -29,43 +62,52 @@ def find_bone(
             + "] not in bones_map! Expected an exact name of a Bone Descriptor."
         )
 
-    def probability_parent(bone_desc_name, bone, stop_counter=0):
-        def debug_print(*msgs):
-            # print("   ", "   ", *msgs)
-            return
-
+    def probability_parent(bone_desc_name, bone, known_score=None):
         if not isinstance(bone_desc_name, str):
             raise TypeError("bone_desc_name must be type str")
 
-        # This check only happens if there is a parent to compare
-        if bone.parent and stop_counter < 3:
+        # Walk up the parent chain iteratively; the recursion was at most 3
+        # deep but paid a frame per level
+        stop_counter = 0
+        while bone.parent and stop_counter < 3:
             parent_name = bone.parent.name
-            parent_desc_name = ""
 
-            if parent_override != None:
+            if parent_override is not None:
                 parent_desc_name = parent_override
-            elif BONE_DESC_MAP[bone_desc_name]["parent"]:
-                parent_desc_name = BONE_DESC_MAP[bone_desc_name]["parent"]
-
-            if parent_desc_name:
-                # If exact match, return bone
-                if parent_name == parent_desc_name:
-                    debug_print("* Exact match ", parent_name, " == ", parent_desc_name)
-                    return 1
-
-                debug_print("Comparing ", parent_name, " to ", parent_desc_name)
-
-                # If the parent is a match, return the bone
-                if 0.8 <= similarity_to_common_names(parent_name, parent_desc_name):
-                    debug_print(bone.name, " seems to be ", bone_desc_name)
-                    return probability_parent(
-                        parent_desc_name, bone.parent, stop_counter + 1
-                    )
-                else:
-                    debug_print("* Not a match!")
-                    return 0
-
-        s = similarity_to_common_names(bone.name, bone_desc_name)
+            else:
+                parent_desc_name = _DESC_PARENT.get(bone_desc_name) or ""
+
+            if not parent_desc_name:
+                break
+
+            # If exact match, return bone
+            if parent_name == parent_desc_name:
+                debug_print("* Exact match ", parent_name, " == ", parent_desc_name)
+                return 1
+
+            debug_print("Comparing ", parent_name, " to ", parent_desc_name)
+
+            # If the parent is a match, step up and check its parent too
+            if 0.8 <= similarity_to_common_names(parent_name, parent_desc_name):
+                debug_print(bone.name, " seems to be ", bone_desc_name)
+                bone_desc_name = parent_desc_name
+                bone = bone.parent
+                stop_counter += 1
+                known_score = None
+            else:
+                debug_print("* Not a match!")
+                return 0
+
+        # The bone_matches loop already scored this bone; reuse it instead
+        # of probing the similarity cache again. After walking up, the
+        # current bone is one the caller hasn't scored.
+        if known_score is not None:
+            s = known_score
+        else:
+            # The walk bonus below adds up to +0.3 before the 0.8 compare,
+            # so scores down to 0.5 still matter here; prune at 0.5 instead
+            # of the default threshold
+            s = similarity_to_common_names(bone.name, bone_desc_name, 0.5)
         s += 0.1 * stop_counter
         if 0.8 <= s:
             debug_print("* Likely match: ", bone.name, " == ", bone_desc_name)
@@ -75,63 +117,67 @@ def find_bone(
             return 0
 
     def check_child(bone_desc_name, bone):
-        def debug_print(*msgs):
-            # print("   ", "   ", *msgs)
-            return
-
         if not isinstance(bone_desc_name, str):
             raise TypeError("bone_desc_name must be type str")
 
+        child_names = _CHILD_NAMES.get(bone_desc_name)
+        if not child_names:
+            return False
+
+        common_names = _CHILD_COMMON_NAMES[bone_desc_name]
+
         for child_bone in bone.children:
             child_name = child_bone.name
 
             debug_print("Checking child:", child_name)
 
-            bone_desc = BONE_DESC_MAP[bone_desc_name]
-
-            # Child descriptor
-            if bone_desc["children"]:
-                for child_desc_name in bone_desc["children"]:
-                    debug_print("Comparing it to:", child_desc_name)
-
-                    # If exact match, return bone
-                    if child_name == child_desc_name:
-                        debug_print(
-                            "* Exact match ", child_name, " == ", child_desc_name
-                        )
-                        return True
+            # If exact match, return bone
+            if child_name in child_names:
+                debug_print("* Exact match ", child_name)
+                return True
 
-                    # If the child is a match, return the bone
-                    if 0.8 <= similarity_to_common_names(child_name, child_desc_name):
-                        debug_print(
-                            "* Child is a good match", bone.name, " is ", bone_desc_name
-                        )
-                        return True
+            # If the child matches any child common name, return the bone
+            for common_name in common_names:
+                if 0.8 <= string_similarity(child_name, common_name):
+                    debug_print(
+                        "* Child is a good match", bone.name, " is ", bone_desc_name
+                    )
+                    return True
 
         return False
 
     bones = []
     if which == "edit":
-        bpy.ops.object.mode_set(mode="EDIT")
+        # mode_set re-evaluates the depsgraph; skip it when already there
+        if bpy.context.mode != "EDIT_ARMATURE":
+            bpy.ops.object.mode_set(mode="EDIT")
         bones = armature.data.edit_bones
     elif which == "pose":
-        bpy.ops.object.mode_set(mode="POSE")
+        if bpy.context.mode != "POSE":
+            bpy.ops.object.mode_set(mode="POSE")
         bones = armature.pose.bones
 
+    # Exact hits are the common case on renamed rigs — one hash lookup
+    # instead of scoring every bone
+    bone = bones.get(bone_desc_name)
+    if bone is not None:
+        return bone
+
+    # Resolved once; the loop below consulted the descriptor per bone
+    desc_mirror = _DESC_MIRROR[bone_desc_name]
+
     bone_matches = []
 
-    # All bones in armature that are similar to the common_names
+    # All bones in armature that are similar to the common_names.
+    # Similarity is computed once per bone here and the [score, bone] pairs
+    # are reused by the parent- and child-verification passes below.
     for bone in bones:
-        # If exact match, return bone
-        if bone.name == bone_desc_name:
-            return bone
-
         # If exists in BONE_DESC_MAP as a different bone, skip
         if bone.name in BONE_DESC_MAP:
             continue
 
         # Depending on mirrorness and x-threshold, skip
-        if BONE_DESC_MAP[bone_desc_name]["mirror"]:
+        if desc_mirror:
             if abs(bone.head.x) <= 0.001 and abs(bone.tail.x) <= 0.001:
                 continue
         else:
@@ -139,7 +185,7 @@ def find_bone(
                 continue
 
         # If wrong x-axis side, skip
-        if BONE_DESC_MAP[bone_desc_name]["mirror"]:
+        if desc_mirror:
             if bone_desc_name.endswith(".L"):
                 if bone.head.x < 0:
                     continue
@@ -147,22 +193,21 @@ def find_bone(
                 if 0 < bone.head.x:
                     continue
 
-        if 0.75 <= similarity_to_common_names(bone.name, bone_desc_name):
-            bone_matches.append(bone)
+        similarity = similarity_to_common_names(bone.name, bone_desc_name)
+        if 0.75 <= similarity:
+            bone_matches.append([similarity, bone])
 
-    debug_print(bone_desc_name + ": Similar names:", [b.name for b in bone_matches])
+    debug_print(bone_desc_name + ": Similar names:", [b[1].name for b in bone_matches])
 
     if len(bone_matches) == 0:
         return None
 
     # Loop over bone_matches and store pairs of [likeliness, bone]
     likely_bone = []
-    for bone in bone_matches:
+    for similarity, bone in bone_matches:
         if bone.parent:
-            if probability_parent(bone_desc_name, bone):
-                likely_bone.append(
-                    [similarity_to_common_names(bone.name, bone_desc_name), bone]
-                )
+            if probability_parent(bone_desc_name, bone, known_score=similarity):
+                likely_bone.append([similarity, bone])
 
     # If a likely one was found, return the max of likely_bone[1]
     if len(likely_bone):
@@ -172,30 +217,24 @@ def find_bone(
         )
         return max(likely_bone, key=lambda b: b[0])[1]
 
-    elif parent_override == None:
+    elif parent_override is None:
         # Check immediate bones, and if they look like what BONE_DESC_MAP describes, add them to likely_bone
-        for bone in bone_matches:
-            if bone.children:
-                for bone in bone_matches:
-                    if check_child(bone_desc_name, bone):
-                        likely_bone.append(
-                            [
-                                similarity_to_common_names(bone.name, bone_desc_name),
-                                bone,
-                            ]
-                        )
-
+        if any(bone.children for similarity, bone in bone_matches):
+            for similarity, bone in bone_matches:
+                if check_child(bone_desc_name, bone):
+                    likely_bone.append([similarity, bone])
+
+            debug_print(
+                bone_desc_name + ": Likely matches:",
+                [(b[1].name) for b in likely_bone],
+            )
+
+            # If a likely one was found, return it
+            if len(likely_bone):
                 debug_print(
-                    bone_desc_name + ": Likely matches:",
+                    bone_desc_name + ": Very likely matches:",
                     [(b[1].name) for b in likely_bone],
                 )
-
-                # If a likely one was found, return it
-                if len(likely_bone):
-                    debug_print(
-                        bone_desc_name + ": Very likely matches:",
-                        [(b[1].name) for b in likely_bone],
-                    )
-                    return max(likely_bone, key=lambda b: b[0])[1]
+                return max(likely_bone, key=lambda b: b[0])[1]
 
     return None
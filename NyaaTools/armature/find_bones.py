@@ -0,0 +1,26 @@
+import bpy
+
+from .find_bone import find_bone
+
+
+# Resolves several descriptors in one edit/pose session and returns
+# {bone_desc_name: bone or None}. The mode is entered once up front;
+# find_bone only switches modes when the context differs, so the whole
+# batch stays in a single session instead of paying one mode_set per
+# descriptor. Fuzzy scores are shared across the batch through the
+# similarity cache.
+def find_bones(which, armature: bpy.types.Armature, bone_desc_names):
+    if which not in ["edit", "pose"]:
+        raise TypeError("which must be either 'edit' or 'pose'")
+
+    if which == "edit":
+        if bpy.context.mode != "EDIT_ARMATURE":
+            bpy.ops.object.mode_set(mode="EDIT")
+    else:
+        if bpy.context.mode != "POSE":
+            bpy.ops.object.mode_set(mode="POSE")
+
+    found = {}
+    for bone_desc_name in bone_desc_names:
+        found[bone_desc_name] = find_bone(which, armature, bone_desc_name)
+    return found
@@ -1,29 +1,47 @@
 import bpy
+from bpy.app.handlers import persistent
+
+
+# Reverse index {armature: [[mesh, modifier], ...]} built by one sweep of
+# bpy.data.objects, so export flows that query several armatures back to
+# back don't rescan the whole scene per call. Any depsgraph update (object
+# added/removed, modifier edited) throws the index away; it is lazily
+# rebuilt on the next query.
+_armature_to_meshes = None
+
+
+@persistent
+def invalidate_affected_meshes_index(scene, depsgraph=None):
+    global _armature_to_meshes
+    _armature_to_meshes = None
 
 
 def find_meshes_affected_by_armature_modifier(armature):
-    ret = []
-    for obj in bpy.data.objects:
-        # Must be a mesh
-        if obj.type != "MESH":
-            continue
-
-        mesh = obj
-
-        # Must be using this armature in the "Armature" modifier
-        # KNOWN ISSUE: If the mesh uses this armature in 2 armature modifiers, something not good will happen
-        using_armature = False
-        which_modifier = None
-        for mod in mesh.modifiers:
-            if mod.type == "ARMATURE":
-                if mod.object == armature:
-                    using_armature = True
-                    which_modifier = mod
-                    break
-        if not using_armature:
-            continue
-
-        # Add to affected_meshes pair: [ mesh, modifier ]
-        ret.append([mesh, which_modifier])
-
-    return ret
+    global _armature_to_meshes
+
+    if _armature_to_meshes is None:
+        _armature_to_meshes = {}
+        for obj in bpy.data.objects:
+            # Must be a mesh
+            if obj.type != "MESH":
+                continue
+
+            mesh = obj
+
+            # Must be using an armature in the "Armature" modifier.
+            # A mesh can carry armature modifiers for several different
+            # armatures; index the first modifier per distinct armature so a
+            # query for any of them finds the mesh.
+            # KNOWN ISSUE: If the mesh uses this armature in 2 armature modifiers, something not good will happen
+            seen_armatures = set()
+            for mod in mesh.modifiers:
+                if mod.type == "ARMATURE":
+                    if mod.object is not None and mod.object not in seen_armatures:
+                        seen_armatures.add(mod.object)
+                        # Pair: ( mesh, modifier ); immutable so cached
+                        # entries can't be reshaped by callers
+                        _armature_to_meshes.setdefault(mod.object, []).append(
+                            (mesh, mod)
+                        )
+
+    return _armature_to_meshes.get(armature, [])
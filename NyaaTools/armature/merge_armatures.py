@@ -16,7 +16,8 @@ def merge_armatures(target_armature, extra_armature, orphan_parent_map):
     Merge two armatures, re-parenting the specified orphan bones.
     """
     def merge_move_objects(target_armature, extra_armature):
-        bpy.ops.object.mode_set(mode='OBJECT')
+        if bpy.context.mode != 'OBJECT':
+            bpy.ops.object.mode_set(mode='OBJECT')
         bpy.ops.object.select_all(action='DESELECT')
         extra_armature.select_set(True)
         bpy.context.view_layer.objects.active = extra_armature
@@ -55,7 +56,8 @@ def merge_armatures(target_armature, extra_armature, orphan_parent_map):
         """
         Delete bones in the extra armature that are in conflict.
         """
-        bpy.ops.object.mode_set(mode='OBJECT')
+        if bpy.context.mode != 'OBJECT':
+            bpy.ops.object.mode_set(mode='OBJECT')
         bpy.context.view_layer.objects.active = armature
         bpy.ops.object.mode_set(mode='EDIT')
 
@@ -64,14 +66,16 @@ def merge_armatures(target_armature, extra_armature, orphan_parent_map):
             if bone_name in edit_bones:
                 print(f"Deleting duplicate bone:  {armature.name} -> {bone_name}")
                 edit_bones.remove(edit_bones[bone_name])
-        bpy.ops.object.mode_set(mode='OBJECT')
+        if bpy.context.mode != 'OBJECT':
+            bpy.ops.object.mode_set(mode='OBJECT')
 
 
     def restore_bone_parenting(armature, original_parents):
         """
         Restore parenting of now the now parentless bones (because of the merge)
         """
-        bpy.ops.object.mode_set(mode='OBJECT')
+        if bpy.context.mode != 'OBJECT':
+            bpy.ops.object.mode_set(mode='OBJECT')
         armature.select_set(True)
         bpy.context.view_layer.objects.active = armature
         bpy.ops.object.mode_set(mode='EDIT')
@@ -88,7 +92,8 @@ def merge_armatures(target_armature, extra_armature, orphan_parent_map):
         """
         Apply new parenting relationships for specified orphan bones according to a given mapping.
         """
-        bpy.ops.object.mode_set(mode='OBJECT')
+        if bpy.context.mode != 'OBJECT':
+            bpy.ops.object.mode_set(mode='OBJECT')
         armature.select_set(True)
         bpy.context.view_layer.objects.active = armature
         bpy.ops.object.mode_set(mode='EDIT')
@@ -106,7 +111,8 @@ def merge_armatures(target_armature, extra_armature, orphan_parent_map):
             else:
                 print(f"Warning: Orphan bone {orphan} not found in the merged armature.")
 
-        bpy.ops.object.mode_set(mode='OBJECT')
+        if bpy.context.mode != 'OBJECT':
+            bpy.ops.object.mode_set(mode='OBJECT')
 
 
     ######################################
@@ -1,16 +1,21 @@
 import bpy
 
-def normalize_armature_clear_custom_objects(armature: bpy.types.Armature):
-    def debug_print(*msgs):
+_DEBUG = False
+
+
+def debug_print(*msgs):
+    if _DEBUG:
         print("   ", *msgs)
-        return
 
 
-    bpy.ops.object.mode_set(mode="OBJECT")
+def normalize_armature_clear_custom_objects(armature: bpy.types.Armature):
+    if bpy.context.mode != "OBJECT":
+        bpy.ops.object.mode_set(mode="OBJECT")
     bpy.context.view_layer.objects.active = armature
 
     # Switch to pose mode
-    bpy.ops.object.mode_set(mode="POSE")
+    if bpy.context.mode != "POSE":
+        bpy.ops.object.mode_set(mode="POSE")
 
     # Iterate over all pose bones and clear custom shapes
     for pose_bone in armature.pose.bones:
@@ -19,4 +24,5 @@ def normalize_armature_clear_custom_objects(armature: bpy.types.Armature):
             pose_bone.custom_shape = None
 
     # Switch back to object mode
-    bpy.ops.object.mode_set(mode="OBJECT")
+    if bpy.context.mode != "OBJECT":
+        bpy.ops.object.mode_set(mode="OBJECT")
@@ -5,7 +5,6 @@ from mathutils import Vector
 from .align_bone_to_axis import align_bone_to_axis as abta
 from .apply_pose import apply_pose
 from .clear_pose import clear_pose
-from .find_bone import find_bone
 from .find_meshes_affected_by_armature_modifier import (
     find_meshes_affected_by_armature_modifier,
 )
@@ -13,22 +12,121 @@ from ..common.deselect_all import deselect_all
 from ..common.selection_add import selection_add
 from ..consts import A_POSE_SHOULDER_ANGLE
 
+_DEBUG = False
+
+
+def debug_print(*msgs):
+    if _DEBUG:
+        print("   ", *msgs)
+
+# A-Pose shoulder drop, precomputed once from the fixed angle
+_A_POSE_Z = math.sin(math.radians(A_POSE_SHOULDER_ANGLE)) / math.sin(
+    math.radians(90 - A_POSE_SHOULDER_ANGLE)
+)
+
+# Alignment passes as (bone name, target axis) rows, iterated by one loop
+# instead of a copy-pasted if-block per bone
+
+_ARM_STEPS = (
+    ("Shoulder.L", (1, 0, 0)),
+    ("Upper Arm.L", (1, 0, 0)),
+    ("Lower Arm.L", (1, 0, 0)),
+    ("Hand.L", (1, 0, 0)),
+)
+
+# 3 joints x 5 fingers; only the thumb leans into -y
+_FINGER_STEPS = tuple(
+    (finger + " " + str(joint) + ".L", axis)
+    for joint in (1, 2, 3)
+    for finger, axis in (
+        ("Thumb", (1, -1, 0)),
+        ("Index Finger", (1, 0, 0)),
+        ("Middle Finger", (1, 0, 0)),
+        ("Ring Finger", (1, 0, 0)),
+        ("Little Finger", (1, 0, 0)),
+    )
+)
+
 
 def normalize_armature_pose(
     armature: bpy.types.Armature,
     which_pose,
     apply_rest_pose,
     callback_progress_tick=None,
+    affected_meshes=None,
 ):
-    def debug_print(*msgs):
-        print("   ", *msgs)
-        return
-
     debug_print("Starting normalize_armature_pose()")
 
+    # Bind the progress callback once instead of None-checking at every step
+    tick = callback_progress_tick if callback_progress_tick is not None else lambda: None
+
+    # Bones are renamed before this runs, so each descriptor resolves by its
+    # exact name. find_bone re-entered a mode and rescanned every bone per
+    # call; resolve from these maps instead. The edit map is rebuilt whenever
+    # edit mode is re-entered, since EditBones don't survive leaving it.
+    pose_map = {}
+    edit_map = {}
+
+    def ensure_mode(which):
+        if which == "edit":
+            if bpy.context.mode != "EDIT_ARMATURE":
+                bpy.ops.object.mode_set(mode="EDIT")
+                edit_map.clear()
+        else:
+            if bpy.context.mode != "POSE":
+                bpy.ops.object.mode_set(mode="POSE")
+
+    def get_bone(which, name):
+        ensure_mode(which)
+        if which == "edit":
+            if not edit_map:
+                for b in armature.data.edit_bones:
+                    edit_map[b.name] = b
+            return edit_map.get(name)
+        else:
+            if not pose_map:
+                for b in armature.pose.bones:
+                    pose_map[b.name] = b
+            return pose_map.get(name)
+
+    def align(which, name, axis_x, axis_y, axis_z):
+        # Resolves the bone and its mirror from the cache up front, so abta
+        # doesn't fall back to a descriptor lookup + find_bone scan for the
+        # mirrored side
+        bone = get_bone(which, name)
+        mirror_bone = None
+        if name.endswith(".L") or name.endswith(".R"):
+            side = "R" if name.endswith(".L") else "L"
+            mirror_bone = get_bone(which, name[:-1] + side)
+        return abta(armature, bone, axis_x, axis_y, axis_z, mirror_bone)
+
+    def zero_translation_y(*bones):
+        # Every sub-element assignment on bone.matrix pokes the RNA
+        # property and re-tags the pose. Mutate a detached copy and write
+        # the matrix back once per bone, skipping bones already at y=0.
+        changed = False
+        for b in bones:
+            m = b.matrix.copy()
+            # Exact != 0 re-flagged the pose for ~1e-16 residuals left by a
+            # previous apply; those don't warrant another apply_pose round
+            if 1e-6 < abs(m.translation.y):
+                m.translation.y = 0
+                b.matrix = m
+                changed = True
+        return changed
+
+    def run_steps(which, steps):
+        nonlocal should_apply
+        for name, (axis_x, axis_y, axis_z) in steps:
+            if align(which, name, axis_x, axis_y, axis_z):
+                should_apply = True
+            tick()
+
     #################
-    # Find all meshes that have an armature modifier with this armature
-    affected_meshes = find_meshes_affected_by_armature_modifier(armature)
+    # Find all meshes that have an armature modifier with this armature.
+    # Callers that already scanned for the progress total pass the list in.
+    if affected_meshes is None:
+        affected_meshes = find_meshes_affected_by_armature_modifier(armature)
     total_shapekeys = 0
     for mesh, modifier in affected_meshes:
         # Show in viewport
@@ -37,11 +135,10 @@ def normalize_armature_pose(
         modifier.use_deform_preserve_volume = True
         mesh.hide_viewport = False
 
-        if mesh.data.shape_keys != None:
+        if mesh.data.shape_keys is not None:
             total_shapekeys += len(mesh.data.shape_keys.key_blocks)
 
-        if callback_progress_tick != None:
-            callback_progress_tick()
+        tick()
 
     deselect_all()
     #################
@@ -54,66 +151,40 @@ def normalize_armature_pose(
     ################
     # Ankle Initialization - Point Ankle bone forward without affecting pose
 
-    if abta(armature, find_bone("edit", armature, "Foot.L"), 0, -1, 0):
+    if align("edit", "Foot.L", 0, -1, 0):
         should_apply = True
-    if callback_progress_tick != None:
-        callback_progress_tick()
+    tick()
 
-    # Align ankle to y-axis
-
-    eb_toes_l = find_bone("edit", armature, "Toes.L")
-    if eb_toes_l:
-        if abta(armature, eb_toes_l, 0, -1, 0):
+    # Align toes to y-axis. align() already runs the mirror pass, so the
+    # explicit Toes.R call re-aligned both sides a second time; the .R
+    # fallback only matters for rigs missing the left toe.
+    if get_bone("edit", "Toes.L"):
+        if align("edit", "Toes.L", 0, -1, 0):
             should_apply = True
-        if callback_progress_tick != None:
-            callback_progress_tick()
-
-    eb_toes_r = find_bone("edit", armature, "Toes.R")
-    if eb_toes_r:
-        if abta(armature, eb_toes_r, 0, -1, 0):
+    elif get_bone("edit", "Toes.R"):
+        if align("edit", "Toes.R", 0, -1, 0):
             should_apply = True
-        if callback_progress_tick != None:
-            callback_progress_tick()
+    tick()
 
     ################
     # Arm
 
-    # Align shoulder to x-axis
-    if abta(armature, find_bone("pose", armature, "Shoulder.L"), 1, 0, 0):
-        should_apply = True
-    if callback_progress_tick != None:
-        callback_progress_tick()
-
-    # Align upper arm to x-axis
-    if abta(armature, find_bone("pose", armature, "Upper Arm.L"), 1, 0, 0):
-        should_apply = True
-    if callback_progress_tick != None:
-        callback_progress_tick()
-
-    # Align elbow to x-axis
-    if abta(armature, find_bone("pose", armature, "Lower Arm.L"), 1, 0, 0):
-        should_apply = True
-    if callback_progress_tick != None:
-        callback_progress_tick()
-
-    # Align wrist to x-axis
-    if abta(armature, find_bone("pose", armature, "Hand.L"), 1, 0, 0):
-        should_apply = True
-    if callback_progress_tick != None:
-        callback_progress_tick()
+    # Align shoulder, upper arm, elbow, wrist to x-axis
+    run_steps("pose", _ARM_STEPS)
 
     ################
     # Shoulder Realignment - Make a temp bone for later
 
     if apply_rest_pose:
-        pb_shoulder_y = find_bone("pose", armature, "Shoulder.L").head.y
-        pb_shoulder_z = find_bone("pose", armature, "Shoulder.L").head.z
+        pb_shoulder_l = get_bone("pose", "Shoulder.L")
+        pb_shoulder_y = pb_shoulder_l.head.y
+        pb_shoulder_z = pb_shoulder_l.head.z
 
-        bpy.ops.object.mode_set(mode="EDIT")
+        ensure_mode("edit")
         eb_realign_shoulder = armature.data.edit_bones.new("__ Shoulder Realign __")
 
-        eb_shoulder_l = find_bone("edit", armature, "Shoulder.L")
-        eb_chest = find_bone("edit", armature, "Chest")
+        eb_shoulder_l = get_bone("edit", "Shoulder.L")
+        eb_chest = get_bone("edit", "Chest")
 
         y = eb_shoulder_l.head.y + (eb_shoulder_l.head.y - pb_shoulder_y)
         z = eb_shoulder_l.head.z + (eb_shoulder_l.head.z - pb_shoulder_z)
@@ -126,245 +197,127 @@ def normalize_armature_pose(
     # Body Round 1
 
     # Edit move hips to thigh's yz-plane
-    hips = find_bone("edit", armature, "Hips")
-    thigh = find_bone("edit", armature, "Upper Leg.L")
-    if thigh.matrix.translation.z != 0:
+    hips = get_bone("edit", "Hips")
+    thigh = get_bone("edit", "Upper Leg.L")
+    if 1e-6 < abs(thigh.matrix.translation.z):
         thigh.matrix.translation.z = 0
         hips.head.y = thigh.matrix.translation.y
         hips.head.z = thigh.matrix.translation.z
-    if callback_progress_tick != None:
-        callback_progress_tick()
+    tick()
 
     # Align hips to z-axis
-    if abta(armature, find_bone("pose", armature, "Hips"), 0, 0, 1):
+    if align("pose", "Hips", 0, 0, 1):
         should_apply = True
-    if callback_progress_tick != None:
-        callback_progress_tick()
+    tick()
 
     # Move hips to y=0
-    hips = find_bone("pose", armature, "Hips")
-    if hips.matrix.translation.y != 0:
-        hips.matrix.translation.y = 0
+    if zero_translation_y(get_bone("pose", "Hips")):
         should_apply = True
-    if callback_progress_tick != None:
-        callback_progress_tick()
+    tick()
 
     ################
     # Body Round 2
 
     # Align spine to z-axis
-    if abta(armature, find_bone("pose", armature, "Spine"), 0, 0, 1):
+    if align("pose", "Spine", 0, 0, 1):
         should_apply = True
-    if callback_progress_tick != None:
-        callback_progress_tick()
+    tick()
 
     # Align thigh to z-axis
-    if abta(armature, find_bone("pose", armature, "Upper Leg.L"), 0, 0, -1):
+    if align("pose", "Upper Leg.L", 0, 0, -1):
         should_apply = True
-    if callback_progress_tick != None:
-        callback_progress_tick()
+    tick()
 
     # Move thigh to y=0
-    thigh_l = find_bone("pose", armature, "Upper Leg.L")
-    thigh_r = find_bone("pose", armature, "Upper Leg.R")
-    if thigh_l.matrix.translation.y != 0:
-        thigh_l.matrix.translation.y = 0
-        thigh_r.matrix.translation.y = 0
+    if zero_translation_y(
+        get_bone("pose", "Upper Leg.L"), get_bone("pose", "Upper Leg.R")
+    ):
         should_apply = True
-    if callback_progress_tick != None:
-        callback_progress_tick()
+    tick()
 
     ################
     # Body Round 3
 
     # Align chest to z-axis
-    if abta(armature, find_bone("pose", armature, "Chest"), 0, 0, 1):
+    if align("pose", "Chest", 0, 0, 1):
         should_apply = True
-    if callback_progress_tick != None:
-        callback_progress_tick()
+    tick()
 
     # Align knee to z-axis
-    if abta(armature, find_bone("pose", armature, "Lower Leg.L"), 0, 0, -1):
+    if align("pose", "Lower Leg.L", 0, 0, -1):
         should_apply = True
-    if callback_progress_tick != None:
-        callback_progress_tick()
+    tick()
 
     ################
     # Body Round 4
 
-    neck = find_bone("pose", armature, "Neck")
+    neck = get_bone("pose", "Neck")
 
     # Move neck to z=0
-    if neck.matrix.translation.y != 0:
-        neck.matrix.translation.y = 0
+    if zero_translation_y(neck):
         should_apply = True
-    if callback_progress_tick != None:
-        callback_progress_tick()
+    tick()
 
     # Align neck to z-axis
-    if abta(armature, neck, 0, 0, 1):
+    if align("pose", "Neck", 0, 0, 1):
         should_apply = True
-    if callback_progress_tick != None:
-        callback_progress_tick()
+    tick()
 
     # Move shoulder to z=0
-    pb_shoulder_l = find_bone("pose", armature, "Shoulder.L")
-    pb_shoulder_r = find_bone("pose", armature, "Shoulder.R")
-    if (
-        pb_shoulder_l.matrix.translation.y != 0
-        or pb_shoulder_r.matrix.translation.y != 0
+    if zero_translation_y(
+        get_bone("pose", "Shoulder.L"), get_bone("pose", "Shoulder.R")
     ):
-        pb_shoulder_l.matrix.translation.y = 0
-        pb_shoulder_r.matrix.translation.y = 0
         should_apply = True
-    if callback_progress_tick != None:
-        callback_progress_tick()
+    tick()
 
     # Align ankle to y-axis
-    if abta(armature, find_bone("pose", armature, "Foot.L"), 0, -1, 0):
+    if align("pose", "Foot.L", 0, -1, 0):
         should_apply = True
-    if callback_progress_tick != None:
-        callback_progress_tick()
+    tick()
 
     ################
     # Body Round 5
 
     # Align head to z-axis
-    if abta(armature, find_bone("pose", armature, "Head"), 0, 0, 1):
+    if align("pose", "Head", 0, 0, 1):
         should_apply = True
-    if callback_progress_tick != None:
-        callback_progress_tick()
+    tick()
 
     # Align toes to y-axis
-    pb_toes_l = find_bone("pose", armature, "Toes.L")
+    pb_toes_l = get_bone("pose", "Toes.L")
     if pb_toes_l:
-        if abta(armature, pb_toes_l, 0, -1, 0):
+        if align("pose", "Toes.L", 0, -1, 0):
             should_apply = True
-        if callback_progress_tick != None:
-            callback_progress_tick()
+        tick()
 
     ################
     # Shoulder Realignment - Temporarily attach to realign_temp_bone
 
     if apply_rest_pose:
-        bpy.ops.object.mode_set(mode="EDIT")
+        ensure_mode("edit")
         eb_realign_shoulder = armature.data.edit_bones["__ Shoulder Realign __"]
-        eb_shoulder_l = find_bone("edit", armature, "Shoulder.L")
-        eb_shoulder_r = find_bone("edit", armature, "Shoulder.R")
+        eb_shoulder_l = get_bone("edit", "Shoulder.L")
+        eb_shoulder_r = get_bone("edit", "Shoulder.R")
         eb_shoulder_l.parent = eb_realign_shoulder
         eb_shoulder_r.parent = eb_realign_shoulder
 
-        bpy.ops.object.mode_set(mode="POSE")
+        ensure_mode("pose")
         pb_realign_shoulder = armature.pose.bones["__ Shoulder Realign __"]
         if abta(armature, pb_realign_shoulder, 0, 0, 1):
             should_apply = True
 
     ################
-    # Fingers Round 1
-
-    # Align "Thumb 1" to x-axis
-    if abta(armature, find_bone("pose", armature, "Thumb 1.L"), 1, -1, 0):
-        should_apply = True
-    if callback_progress_tick != None:
-        callback_progress_tick()
-
-    # Align "Index Finger 1" to x-axis
-    if abta(armature, find_bone("pose", armature, "Index Finger 1.L"), 1, 0, 0):
-        should_apply = True
-    if callback_progress_tick != None:
-        callback_progress_tick()
-
-    # Align "Middle Finger 1" to x-axis
-    if abta(armature, find_bone("pose", armature, "Middle Finger 1.L"), 1, 0, 0):
-        should_apply = True
-    if callback_progress_tick != None:
-        callback_progress_tick()
-
-    # Align "Ring Finger 1" to x-axis
-    if abta(armature, find_bone("pose", armature, "Ring Finger 1.L"), 1, 0, 0):
-        should_apply = True
-    if callback_progress_tick != None:
-        callback_progress_tick()
-
-    # Align "Little Finger 1" to x-axis
-    if abta(armature, find_bone("pose", armature, "Little Finger 1.L"), 1, 0, 0):
-        should_apply = True
-    if callback_progress_tick != None:
-        callback_progress_tick()
-
-    ################
-    # Fingers Round 2
+    # Fingers Rounds 1-3
 
-    # Align "Thumb 2" to x-axis
-    if abta(armature, find_bone("pose", armature, "Thumb 2.L"), 1, -1, 0):
-        should_apply = True
-    if callback_progress_tick != None:
-        callback_progress_tick()
-
-    # Align "Index Finger 2" to x-axis
-    if abta(armature, find_bone("pose", armature, "Index Finger 2.L"), 1, 0, 0):
-        should_apply = True
-    if callback_progress_tick != None:
-        callback_progress_tick()
-
-    # Align "Middle Finger 2" to x-axis
-    if abta(armature, find_bone("pose", armature, "Middle Finger 2.L"), 1, 0, 0):
-        should_apply = True
-    if callback_progress_tick != None:
-        callback_progress_tick()
-
-    # Align "Ring Finger 2" to x-axis
-    if abta(armature, find_bone("pose", armature, "Ring Finger 2.L"), 1, 0, 0):
-        should_apply = True
-    if callback_progress_tick != None:
-        callback_progress_tick()
-
-    # Align "Little Finger 2" to x-axis
-    if abta(armature, find_bone("pose", armature, "Little Finger 2.L"), 1, 0, 0):
-        should_apply = True
-    if callback_progress_tick != None:
-        callback_progress_tick()
-
-    ################
-    # Fingers Round 3
-
-    # Align "Thumb 3" to x-axis
-    if abta(armature, find_bone("pose", armature, "Thumb 3.L"), 1, -1, 0):
-        should_apply = True
-    if callback_progress_tick != None:
-        callback_progress_tick()
-
-    # Align "Index Finger 3" to x-axis
-    if abta(armature, find_bone("pose", armature, "Index Finger 3.L"), 1, 0, 0):
-        should_apply = True
-    if callback_progress_tick != None:
-        callback_progress_tick()
-
-    # Align "Middle Finger 3" to x-axis
-    if abta(armature, find_bone("pose", armature, "Middle Finger 3.L"), 1, 0, 0):
-        should_apply = True
-    if callback_progress_tick != None:
-        callback_progress_tick()
-
-    # Align "Ring Finger 3" to x-axis
-    if abta(armature, find_bone("pose", armature, "Ring Finger 3.L"), 1, 0, 0):
-        should_apply = True
-    if callback_progress_tick != None:
-        callback_progress_tick()
-
-    # Align "Little Finger 3" to x-axis
-    if abta(armature, find_bone("pose", armature, "Little Finger 3.L"), 1, 0, 0):
-        should_apply = True
-    if callback_progress_tick != None:
-        callback_progress_tick()
+    # Align each finger joint to the x-axis, round by round
+    run_steps("pose", _FINGER_STEPS)
 
     # A-Pose only
     if which_pose == "a-pose":
-        a = A_POSE_SHOULDER_ANGLE
-        z = math.sin(math.radians(a)) / math.sin(math.radians(90 - a))
+        z = _A_POSE_Z
 
-        abta(armature, find_bone("pose", armature, "Shoulder.L"), 1, 0, -z)
-        abta(armature, find_bone("pose", armature, "Upper Arm.L"), 1, 0, -1)
+        align("pose", "Shoulder.L", 1, 0, -z)
+        align("pose", "Upper Arm.L", 1, 0, -1)
 
     ################
     # Apply to all meshes / shape keys
@@ -377,11 +330,11 @@ def normalize_armature_pose(
     # Shoulder Realignment - Remove temporary realign_temp_bone
 
     if apply_rest_pose:
-        bpy.ops.object.mode_set(mode="EDIT")
+        ensure_mode("edit")
         eb_realign_shoulder = armature.data.edit_bones["__ Shoulder Realign __"]
-        eb_shoulder_l = find_bone("edit", armature, "Shoulder.L")
-        eb_shoulder_r = find_bone("edit", armature, "Shoulder.R")
-        eb_chest = find_bone("edit", armature, "Chest")
+        eb_shoulder_l = get_bone("edit", "Shoulder.L")
+        eb_shoulder_r = get_bone("edit", "Shoulder.R")
+        eb_chest = get_bone("edit", "Chest")
         eb_shoulder_l.parent = eb_chest
         eb_shoulder_r.parent = eb_chest
         armature.data.edit_bones.remove(eb_realign_shoulder)
@@ -390,8 +343,8 @@ def normalize_armature_pose(
     # Eye Length (if exists)
 
     DEFAULT_LENGTH = 0.05
-    eb_eye_l = find_bone("edit", armature, "Eye.L")
-    eb_eye_r = find_bone("edit", armature, "Eye.R")
+    eb_eye_l = get_bone("edit", "Eye.L")
+    eb_eye_r = get_bone("edit", "Eye.R")
     if eb_eye_l and eb_eye_r:
         if (eb_eye_l.tail.z - eb_eye_l.head.z) != DEFAULT_LENGTH:
             eb_eye_l.tail.x = eb_eye_l.head.x
@@ -405,10 +358,10 @@ def normalize_armature_pose(
     ################
     # Breast Root
 
-    eb_breast_root = find_bone("edit", armature, "Breast Root")
+    eb_breast_root = get_bone("edit", "Breast Root")
     if eb_breast_root:
-        eb_chest = find_bone("edit", armature, "Chest")
-        eb_breast_l = find_bone("edit", armature, "Breast.L")
+        eb_chest = get_bone("edit", "Chest")
+        eb_breast_l = get_bone("edit", "Breast.L")
 
         eb_breast_root.head = (
             0,
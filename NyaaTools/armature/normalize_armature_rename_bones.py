@@ -3,12 +3,15 @@ import bpy
 from ..armature.find_bone import find_bone
 from ..bone_desc_map import BONE_DESC_MAP
 
+_DEBUG = False
 
-def normalize_armature_rename_bones(armature: bpy.types.Armature, cleanup: bool = True):
-    def debug_print(*msgs):
+
+def debug_print(*msgs):
+    if _DEBUG:
         print("   ", *msgs)
-        return
 
+
+def normalize_armature_rename_bones(armature: bpy.types.Armature, cleanup: bool = True):
     def perform_rename(bone_desc_name, bone):
         if bone.name == bone_desc_name:
             debug_print("Name is good: ", bone.name)
@@ -27,8 +30,8 @@ def normalize_armature_rename_bones(armature: bpy.types.Armature, cleanup: bool
             continue
 
         bone = find_bone("edit", armature, bone_desc_name)
-        if bone == None:
-            if "optional" in bone_desc and bone_desc["optional"]:
+        if bone is None:
+            if bone_desc.optional:
                 continue
             else:
                 raise TypeError("Couldn't find bone: " + bone_desc_name)
@@ -37,12 +40,14 @@ def normalize_armature_rename_bones(armature: bpy.types.Armature, cleanup: bool
 
         if cleanup:
             # Check if bone is connected
-            if "connected" in bone_desc and bone_desc["connected"]:
+            if bone_desc.connected:
                 if not bone.use_connect:
                     debug_print("Connecting bone: ", bone.name)
 
-                    # Move parent's tail to this head
-                    bone.parent.tail = bone.head
+                    # Move parent's tail to this head; tail writes propagate
+                    # through the depsgraph, so skip when already there
+                    if 1e-12 < (bone.parent.tail - bone.head).length_squared:
+                        bone.parent.tail = bone.head
 
                     bone.use_connect = True
             else:
@@ -53,15 +58,15 @@ def normalize_armature_rename_bones(armature: bpy.types.Armature, cleanup: bool
 
     # Handle breast bones
     using_breast_bones = (
-        find_bone("edit", armature, "Breast Root") != None
-        or find_bone("edit", armature, "Breast.L") != None
-        or find_bone("edit", armature, "Breast.R") != None
-        or find_bone("edit", armature, "Breast.L", "Chest") != None
-        or find_bone("edit", armature, "Breast.R", "Chest") != None
+        find_bone("edit", armature, "Breast Root") is not None
+        or find_bone("edit", armature, "Breast.L") is not None
+        or find_bone("edit", armature, "Breast.R") is not None
+        or find_bone("edit", armature, "Breast.L", "Chest") is not None
+        or find_bone("edit", armature, "Breast.R", "Chest") is not None
     )
     if using_breast_bones:
         breastRoot = find_bone("edit", armature, "Breast Root")
-        if breastRoot != None:
+        if breastRoot is not None:
             # Root already exists, just rename it
             if breastRoot.name == "Breast Root":
                 debug_print("Name is good: ", breastRoot.name)
@@ -73,7 +78,7 @@ def normalize_armature_rename_bones(armature: bpy.types.Armature, cleanup: bool
             breastL = find_bone("edit", armature, "Breast.L", "Chest")
             breastR = find_bone("edit", armature, "Breast.R", "Chest")
 
-            if breastL != None and breastR != None:
+            if breastL is not None and breastR is not None:
                 new_z = breastL.head.z
 
                 breastRoot = armature.data.edit_bones.new("Breast Root")
@@ -3,12 +3,15 @@ import bpy
 
 from ..bone_desc_map import BONE_DESC_MAP
 
+_DEBUG = False
 
-def normalize_armature_retarget(armature, source_armature, animation_name: str):
-	def debug_print(*msgs):
+
+def debug_print(*msgs):
+	if _DEBUG:
 		print("   ", *msgs)
-		return
 
+
+def normalize_armature_retarget(armature, source_armature, animation_name: str):
 	if armature is None or armature.type != "ARMATURE":
 		raise Exception("Expected a target armature")
 
@@ -18,11 +21,16 @@ def normalize_armature_retarget(armature, source_armature, animation_name: str):
 	debug_print("Animation:", animation_name)
 
 	# Switch to pose mode
-	bpy.ops.object.mode_set(mode="POSE")
+	if bpy.context.mode != "POSE":
+		bpy.ops.object.mode_set(mode="POSE")
+
+	# Only descriptors actually present in the armature need visiting
+	pose_bones = armature.pose.bones
+	pose_names = {b.name for b in pose_bones}
 
 	for bone_desc_name in BONE_DESC_MAP:
-		if bone_desc_name in armature.pose.bones:
-			target_bone = armature.pose.bones[bone_desc_name]
+		if bone_desc_name in pose_names:
+			target_bone = pose_bones[bone_desc_name]
 
 			debug_print("Processing bone:", target_bone.name)
 
@@ -4,42 +4,21 @@ import bpy
 from ..bone_desc_map import BONE_DESC_MAP
 from ..consts import A_POSE_SHOULDER_ANGLE
 
+_DEBUG = False
 
-def normalize_armature_roll_bones(
-    armature: bpy.types.Armature, which_pose, apply_roll=False
-):
-    def debug_print(*msgs):
-        print("   ", *msgs)
-        return
-
-    if not isinstance(apply_roll, bool):
-        raise Exception("apply_roll must be a boolean")
-
-    debug_print("Starting normalize_armature_roll_bones()")
-
-    # Switch to edit mode
-    bpy.ops.object.mode_set(mode="EDIT")
-
-    # Iterate over descriptors in BONE_DESC_MAP & reset their roll
-    for bone_desc_name in BONE_DESC_MAP:
-        bone_desc = BONE_DESC_MAP[bone_desc_name]
 
-        if not bone_desc_name in armature.data.edit_bones:
-            continue
-
-        # Get bone
-        bone = armature.data.edit_bones[bone_desc_name]
-
-        # Clear roll instead if !apply_roll
-        if not apply_roll:
-            debug_print("Clearing roll of", bone.name)
-            bone.roll = 0
-            continue
+def debug_print(*msgs):
+    if _DEBUG:
+        print("   ", *msgs)
 
-        desc_roll = 0
 
-        if "roll" in bone_desc and bone_desc["roll"] != None:
-            desc_roll = bone_desc["roll"]
+# The target roll per descriptor is a constant per pose; fold the A-Pose
+# adjustments and the deg->rad conversion once at import instead of per
+# bone on every call
+def _pose_roll_radians(which_pose):
+    rolls = {}
+    for bone_desc_name, bone_desc in BONE_DESC_MAP.items():
+        desc_roll = bone_desc.roll if bone_desc.roll is not None else 0
 
         if which_pose == "a-pose":
             sw = bone_desc_name.startswith
@@ -50,7 +29,6 @@ def normalize_armature_roll_bones(
                 if bone_desc_name.endswith(".R"):
                     r *= -1
                 desc_roll += r
-                debug_print("For A-Pose, shoulder", desc_roll)
 
             # Arm and below:
             if (
@@ -67,8 +45,49 @@ def normalize_armature_roll_bones(
                 if bone_desc_name.endswith(".R"):
                     r *= -1
                 desc_roll += r
-                debug_print("For A-Pose, arm and below", desc_roll)
 
-        if bone.roll != desc_roll:
+        rolls[bone_desc_name] = math.radians(desc_roll)
+    return rolls
+
+
+_POSE_ROLLS = {
+    "t-pose": _pose_roll_radians("t-pose"),
+    "a-pose": _pose_roll_radians("a-pose"),
+}
+
+
+def normalize_armature_roll_bones(
+    armature: bpy.types.Armature, which_pose, apply_roll=False
+):
+    if not isinstance(apply_roll, bool):
+        raise Exception("apply_roll must be a boolean")
+
+    debug_print("Starting normalize_armature_roll_bones()")
+
+    # Switch to edit mode (the pose pass usually leaves us there already)
+    if bpy.context.mode != "EDIT_ARMATURE":
+        bpy.ops.object.mode_set(mode="EDIT")
+
+    edit_bones = armature.data.edit_bones
+    rolls = _POSE_ROLLS["a-pose"] if which_pose == "a-pose" else _POSE_ROLLS["t-pose"]
+
+    # Iterate over descriptors in BONE_DESC_MAP & reset their roll.
+    # .get resolves presence and the bone in one hash lookup; descriptors
+    # missing from the armature are skipped.
+    for bone_desc_name in BONE_DESC_MAP:
+        bone = edit_bones.get(bone_desc_name)
+        if bone is None:
+            continue
+
+        # Clear roll instead if !apply_roll
+        if not apply_roll:
+            debug_print("Clearing roll of", bone.name)
+            bone.roll = 0
+            continue
+
+        desc_roll = rolls[bone_desc_name]
+
+        # Property writes tag the depsgraph; skip sub-tolerance differences
+        if 1e-6 < abs(bone.roll - desc_roll):
             debug_print("Setting roll of", bone.name, "to", desc_roll)
-            bone.roll = math.radians(desc_roll)
+            bone.roll = desc_roll
@@ -1,17 +1,65 @@
+import re
+from functools import lru_cache
+
 from ..common.string_similarity import string_similarity
 from ..bone_desc_map import BONE_DESC_MAP
 
+# Lowest score threshold most find_bone callers compare against. Callers
+# that accept lower scores (e.g. after subtracting a bonus they add on
+# top) pass their own threshold so the pruning stays sound.
+_SCORE_THRESHOLD = 0.75
+
+# Same length-changing substitutions string_similarity applies
+_RE_LAZY_DUPLICATE = re.compile(r"\.\d{3}")
+_RE_LEADING_ZEROS = re.compile(r"([^a-z0-9])0+(\d)")
+
+
+def _max_possible(a: int, b: int) -> float:
+    # Upper bound of string_similarity for strings of lengths a and b
+    if a < 2 or b < 2:
+        return 0
+    return 2 * (min(a, b) - 1) / (a + b - 2)
+
 
-def similarity_to_common_names(bone_name: str, bone_desc_name: str) -> float:
+def _effective_length(name: str) -> int:
+    return len(_RE_LEADING_ZEROS.sub(r"\1\2", _RE_LAZY_DUPLICATE.sub("", name)))
+
+
+# The descriptor side never changes, so its effective lengths are computed
+# once at import; only the bone-name side is normalized per call
+_COMMON_NAME_LENGTHS = {
+    _desc_name: tuple(
+        (_common_name, _effective_length(_common_name))
+        for _common_name in _desc.common_names
+    )
+    for _desc_name, _desc in BONE_DESC_MAP.items()
+    if _desc.common_names
+}
+
+
+# Pure in both string arguments (the descriptor table is immutable), so
+# repeat scorings of the same pair — common across the candidate, parent,
+# and child passes of find_bone — come straight from the cache
+@lru_cache(maxsize=4096)
+def similarity_to_common_names(
+    bone_name: str, bone_desc_name: str, threshold: float = _SCORE_THRESHOLD
+) -> float:
     if not isinstance(bone_desc_name, str):
         raise TypeError("bone_desc_name must be type str")
 
-    common_names = BONE_DESC_MAP[bone_desc_name]["common_names"]
+    common_names = _COMMON_NAME_LENGTHS.get(bone_desc_name)
     if common_names:
-        # Return largest string_similarity value
+        # Effective length after the substitutions that shrink the name
+        n = _effective_length(bone_name)
+
+        # Return largest string_similarity value.
+        # Skip names whose length difference alone caps the score below
+        # the threshold; the bigram comparison can't beat _max_possible.
         return max(
             string_similarity(bone_name, common_name)
-            for common_name in common_names
+            if threshold <= _max_possible(n, common_length)
+            else 0
+            for common_name, common_length in common_names
         )
     else:
         return string_similarity(bone_name, bone_desc_name)
@@ -12,7 +12,7 @@ def apply_avatar_mesh(obj, armature=None):
         if uv.name.startswith("--"):
             obj.data.uv_layers.remove(uv)
 
-    if armature != None:
+    if armature is not None:
         obj.modifiers.new(name="Armature", type="ARMATURE")
         obj.modifiers["Armature"].object = armature
         obj.parent = armature
@@ -7,7 +7,7 @@ from ..common.selection_add import selection_add
 
 
 def apply_avatar_modifiers(obj):
-    if obj == None:
+    if obj is None:
         raise BaseException("applyModifiers() :: Expected a mesh object, got: None")
 
     selection_add(obj)
@@ -29,7 +29,7 @@ def apply_avatar_modifiers(obj):
             # Remove armature modifiers that target any avatars. These are purely for blender viewing and will be reconfigured by the tool
             # Otherwise apply it
 
-            if modifier.object == None:
+            if modifier.object is None:
                 bpy.ops.object.modifier_remove(modifier=modifier.name)
                 continue
 
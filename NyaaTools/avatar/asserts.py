@@ -2,9 +2,9 @@ import bpy
 
 
 def assert_uv_match(obj1, obj2):
-    if (obj1 == None):
+    if (obj1 is None):
         raise Exception("assertUVMatch() :: Expected an object, got: None")
-    if (obj2 == None):
+    if (obj2 is None):
         raise Exception("assertUVMatch() :: Expected an object, got: None")
 
     if (len(obj1.data.uv_layers) != len(obj2.data.uv_layers)):
@@ -0,0 +1,55 @@
+import bpy
+from bpy.app.handlers import persistent
+
+from ..common.get_prop import get_prop
+from ..consts import PROP_AVATAR_LAYERS, PROP_AVATAR_NAME
+
+
+# One sweep of bpy.data.objects classifying everything the avatar helpers
+# ask about, so an export doesn't rescan the scene once per helper call:
+# - "armatures": {avatar_name: armature object} (first match wins)
+# - "armature_names": armature object names with an avatar prop set
+# - "meshes": {avatar_name: [mesh names]} from the layer paths
+# Dropped on any depsgraph update and lazily rebuilt on the next query.
+_avatar_index = None
+
+
+@persistent
+def invalidate_avatar_index(scene, depsgraph=None):
+    global _avatar_index
+    _avatar_index = None
+
+
+def build_avatar_index():
+    global _avatar_index
+
+    if _avatar_index is None:
+        armatures = {}
+        armature_names = []
+        meshes = {}
+
+        for obj in bpy.data.objects:
+            if (obj.type == "ARMATURE"):
+                key = get_prop(obj, PROP_AVATAR_NAME)
+                if (key is not None):
+                    if (key not in armatures):
+                        armatures[key] = obj
+                    if (key not in armature_names):
+                        armature_names.append(obj.name)
+            elif (obj.type == "MESH"):
+                key = get_prop(obj, PROP_AVATAR_LAYERS)
+                if (key is not None):
+                    keySplit = key.split(",") if key != "" else []
+                    for path in keySplit:
+                        path = path.strip()
+                        if ("/" in path):
+                            path_avatar_name = path.split("/")[0]
+                            meshes.setdefault(path_avatar_name, []).append(obj.name)
+
+        _avatar_index = {
+            "armatures": armatures,
+            "armature_names": armature_names,
+            "meshes": meshes,
+        }
+
+    return _avatar_index
@@ -1,14 +1,5 @@
-import bpy
-
-from ..common.get_prop import get_prop
-from ..consts import PROP_AVATAR_NAME
+from .build_avatar_index import build_avatar_index
 
 
 def get_avatar_armature(avatar_name):
-    for obj in bpy.data.objects:
-        if (obj.type == "ARMATURE"):
-            key = get_prop(obj, PROP_AVATAR_NAME)
-            if (key != None):
-                if (key == avatar_name):
-                    return obj
-    return None
+    return build_avatar_index()["armatures"].get(avatar_name)
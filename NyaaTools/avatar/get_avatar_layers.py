@@ -7,12 +7,12 @@ from ..consts import PROP_AVATAR_LAYERS
 def get_avatar_layers(mesh, avatar_name = None):
     ret = []
     layers = get_prop(mesh, PROP_AVATAR_LAYERS)
-    if (layers != None):
+    if (layers is not None):
         split = layers.split(",") if layers != "" else []
         for path in split:
             path_parts = path.split("/") if path != "" else []
             path_avatar_name = path_parts[0]
             path_layer_name = path_parts[1]
-            if avatar_name == None or avatar_name == path_avatar_name:
+            if avatar_name is None or avatar_name == path_avatar_name:
                 ret.append([path_avatar_name, path_layer_name])
     return ret
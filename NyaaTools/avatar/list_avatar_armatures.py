@@ -1,14 +1,6 @@
-import bpy
-
-from ..common.get_prop import get_prop
-from ..consts import PROP_AVATAR_NAME
+from .build_avatar_index import build_avatar_index
 
 
 def list_avatar_armatures():
-    armatures = []
-    for obj in bpy.data.objects:
-        if (obj.type == "ARMATURE"):
-            key = get_prop(obj, PROP_AVATAR_NAME)
-            if (key != None and key not in armatures):
-                armatures.append(obj.name)
-    return armatures
+    # Copy so callers can't mutate the cached index
+    return list(build_avatar_index()["armature_names"])
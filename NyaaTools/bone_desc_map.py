@@ -1,5 +1,47 @@
 # This bone description map is used to
-BONE_DESC_MAP = {
+
+
+# Descriptor entries are looked up thousands of times per normalize pass.
+# __slots__ makes each field access a single slot offset instead of the
+# two hash lookups a dict-of-dicts costs.
+class _BoneDesc:
+    __slots__ = (
+        "common_names",
+        "parent",
+        "children",
+        "mirror",
+        "connected",
+        "roll",
+        "optional",
+    )
+
+    def __init__(
+        self,
+        common_names=None,
+        parent=None,
+        children=None,
+        mirror=None,
+        connected=False,
+        roll=None,
+        optional=False,
+    ):
+        self.common_names = common_names
+        self.parent = parent
+        self.children = children
+        self.mirror = mirror
+        self.connected = connected
+        self.roll = roll
+        self.optional = optional
+
+    # Dict-style access kept for compatibility with string-key callers
+    def __getitem__(self, key):
+        return getattr(self, key)
+
+    def get(self, key, default=None):
+        return getattr(self, key, default)
+
+
+_RAW_BONE_DESC_MAP = {
     # Bone Descriptions
     "Hips": {
         "common_names": ["Hips", "Hip", "Pelvis"],
@@ -454,3 +496,7 @@ BONE_DESC_MAP = {
         "connected": True,
     },
 }
+
+BONE_DESC_MAP = {
+    name: _BoneDesc(**desc) for name, desc in _RAW_BONE_DESC_MAP.items()
+}
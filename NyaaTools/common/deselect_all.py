@@ -2,5 +2,8 @@ import bpy
 
 
 def deselect_all():
-    bpy.ops.object.mode_set(mode="OBJECT")
-    bpy.ops.object.select_all(action="DESELECT")
+    # Switching modes walks the whole depsgraph; skip it when already there
+    if bpy.context.mode != "OBJECT":
+        bpy.ops.object.mode_set(mode="OBJECT")
+    if bpy.context.selected_objects:
+        bpy.ops.object.select_all(action="DESELECT")
@@ -2,9 +2,15 @@ from ..consts import PROP_AVATAR_EXPORT_PATH, PROP_AVATAR_LAYERS, PROP_AVATAR_NA
 
 
 def get_prop(obj, key):
-    if obj == None:
+    if obj is None:
         raise Exception("Expected an object")
 
+    # .get() is a single C-level lookup; `key in obj.keys()` iterated every
+    # custom property through RNA first
+    value = obj.get(key)
+    if value is not None:
+        return value
+
     # v0 -> v1 Migration
     fallback_key = None
     if (key == PROP_AVATAR_NAME):
@@ -14,9 +20,7 @@ def get_prop(obj, key):
     elif (key == PROP_AVATAR_EXPORT_PATH):
         fallback_key = "exportPath"
 
-    if (key in obj.keys()):
-        return obj[key]
-    elif (fallback_key != None and fallback_key in obj.keys()):
-        return obj[fallback_key]
+    if (fallback_key is not None):
+        return obj.get(fallback_key)
 
     return None
@@ -1,7 +1,7 @@
 # Primitive positive value check
 def has_value(value):
     # check type
-    if value == None:
+    if value is None:
         return False
     if isinstance(value, str):
         return value.strip() != ""
@@ -2,7 +2,7 @@ from ..consts import PROP_AVATAR_EXPORT_PATH, PROP_AVATAR_LAYERS, PROP_AVATAR_NA
 
 
 def set_prop(obj, key, value):
-    if obj == None:
+    if obj is None:
         raise Exception("Expected an object")
 
     # v0 -> v1 Migration
@@ -14,7 +14,7 @@ def set_prop(obj, key, value):
     elif (key == PROP_AVATAR_EXPORT_PATH):
         fallback_key = "exportPath"
 
-    if fallback_key != None:
+    if fallback_key is not None:
         try:
             obj[fallback_key] = ""
             del obj[fallback_key]
@@ -1,6 +1,42 @@
-from collections import defaultdict
 import re
 
+import numpy
+
+# Compiled once; re's internal cache would still pay a dict lookup per call
+_RE_LAZY_DUPLICATE = re.compile(r"\.\d{3}")
+_RE_LEADING_ZEROS = re.compile(r"([^a-z0-9])0+(\d)")
+_RE_SEPARATORS = re.compile(r"(?:_|\.)")
+
+# Numba is optional; when present the bigram counting runs as compiled
+# machine code instead of numpy's generic set routines. cache=True keeps
+# the compiled kernel on disk, so the JIT cost is paid once per machine.
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+if njit is not None:
+
+    # Two-pointer merge over sorted bigram multisets. Bone names produce a
+    # handful of bigrams, so walking two short sorted arrays beats zeroing
+    # a 65536-entry histogram per call; duplicate bigrams repeat in the
+    # sorted arrays, which makes the merge count the multiset minimum.
+    @njit(cache=True)
+    def _count_bigram_matches(bigrams1, bigrams2):
+        match = 0
+        i = 0
+        j = 0
+        while i < len(bigrams1) and j < len(bigrams2):
+            if bigrams1[i] == bigrams2[j]:
+                match += 1
+                i += 1
+                j += 1
+            elif bigrams1[i] < bigrams2[j]:
+                i += 1
+            else:
+                j += 1
+        return match
+
 
 def string_similarity(str1: str, str2: str) -> float:
     if not isinstance(str1, str):
@@ -9,13 +45,13 @@ def string_similarity(str1: str, str2: str) -> float:
         raise TypeError("str2 must be str type")
 
     # Regex removes substr .001, .002, 01, 02, etc. from name
-    str1 = re.sub(r"\.\d{3}", "", str1)  # Lazy duplicates
-    str1 = re.sub(r"([^a-z0-9])0+(\d)", r"\1\2", str1)  # Leading 0's
-    str1 = re.sub(r"(?:_|\.)", " ", str1)  # Underscores & periods
+    str1 = _RE_LAZY_DUPLICATE.sub("", str1)  # Lazy duplicates
+    str1 = _RE_LEADING_ZEROS.sub(r"\1\2", str1)  # Leading 0's
+    str1 = _RE_SEPARATORS.sub(" ", str1)  # Underscores & periods
 
-    str2 = re.sub(r"\.\d{3}", "", str2)  # Lazy duplicates
-    str2 = re.sub(r"([^a-z0-9])0+(\d)", r"\1\2", str2)  # Leading 0's
-    str2 = re.sub(r"(?:_|\.)", " ", str2)  # Underscores & periods
+    str2 = _RE_LAZY_DUPLICATE.sub("", str2)  # Lazy duplicates
+    str2 = _RE_LEADING_ZEROS.sub(r"\1\2", str2)  # Leading 0's
+    str2 = _RE_SEPARATORS.sub(" ", str2)  # Underscores & periods
 
     # , substring_length: Optional[int] = 2, case_sensitive: Optional[bool] = False
     substring_length = 2
@@ -26,15 +62,24 @@ def string_similarity(str1: str, str2: str) -> float:
         str2 = str2.lower()
     if len(str1) < substring_length or len(str2) < substring_length:
         return 0
-    substr_count1 = defaultdict(int)
-    for i in range(len(str1) - substring_length + 1):
-        substr1 = str1[i : i + substring_length]
-        substr_count1[substr1] += 1
-    match = 0
-    for j in range(len(str2) - substring_length + 1):
-        substr2 = str2[j : j + substring_length]
-        count = substr_count1[substr2]
-        if count > 0:
-            substr_count1[substr2] = count - 1
-            match += 1
+
+    # Pack each 2-char substring into one int and histogram them in numpy,
+    # so the counting loop runs in C instead of the interpreter
+    bytes1 = numpy.frombuffer(str1.encode("latin-1", "replace"), numpy.uint8)
+    bytes2 = numpy.frombuffer(str2.encode("latin-1", "replace"), numpy.uint8)
+
+    bigrams1 = (bytes1[:-1].astype(numpy.int32) << 8) | bytes1[1:]
+    bigrams2 = (bytes2[:-1].astype(numpy.int32) << 8) | bytes2[1:]
+
+    if njit is not None:
+        match = _count_bigram_matches(numpy.sort(bigrams1), numpy.sort(bigrams2))
+    else:
+        # Histogram the packed bigrams with bincount — one C pass per
+        # string — and take the multiset intersection as an elementwise
+        # minimum. For the short names find_bone feeds through here this
+        # beats the sort unique/intersect1d would do.
+        hist1 = numpy.bincount(bigrams1, minlength=65536)
+        hist2 = numpy.bincount(bigrams2, minlength=65536)
+        match = int(numpy.minimum(hist1, hist2).sum())
+
     return (match * 2) / (len(str1) + len(str2) - ((substring_length - 1) * 2))
@@ -4,7 +4,7 @@ from .remove_unused_materials import remove_unused_materials
 
 
 def cleanup_mesh(obj):
-    if (obj == None):
+    if (obj is None):
         raise BaseException(
             "cleanupMesh() :: Expected a mesh object, got: None")
     if (obj.type != "MESH"):
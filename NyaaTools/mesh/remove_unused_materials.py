@@ -2,31 +2,35 @@ import bpy
 
 from ..common.selection_add import selection_add
 
+_DEBUG = False
 
-def remove_unused_materials(obj):
-    def debug_print(*msgs):
+
+def debug_print(*msgs):
+    if _DEBUG:
         print("   ", *msgs)
-        return
 
-    if obj.type == None:
+
+def remove_unused_materials(obj):
+    if obj.type is None:
         raise BaseException("Expected a mesh object, got: None")
     if obj.type != "MESH":
         raise BaseException("Expected a mesh object, got: " + obj.type)
 
-    mat_slots = {}
-    for p in obj.data.polygons:
-        mat_slots[p.material_index] = 1
+    used_slots = {p.material_index for p in obj.data.polygons}
 
-    mat_slots = mat_slots.keys()
+    # Unhide/select/activate once; it doesn't change between removals
+    selection_made = False
 
     for i in reversed(range(len(obj.material_slots))):
-        if i not in mat_slots:
+        if i not in used_slots:
             mat_name = obj.material_slots[i].name
             if mat_name != "":
                 mat_name = " (" + mat_name + ")"
             debug_print("Removing material slot: ", obj.name,
                         " -> ", i, mat_name)
 
-            selection_add(obj)
+            if not selection_made:
+                selection_add(obj)
+                selection_made = True
             obj.active_material_index = i
             bpy.ops.object.material_slot_remove()
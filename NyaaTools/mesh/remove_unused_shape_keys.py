@@ -2,13 +2,31 @@ import bpy
 import numpy
 from ..consts import SHAPE_KEY_TOLERANCE
 
+# Elements scanned per chunk in the delta test (~64 KiB of float32)
+_CHUNK = 16384
 
-def remove_unused_shape_keys(obj):
-    def debug_print(*msgs):
+# Grow-only scratch shared across calls; cleanup passes run this per mesh
+# and the multi-MB arrays would otherwise be reallocated for every one
+_SCRATCH = {"locs": None, "rel_locs": None}
+
+
+def _scratch(name, size):
+    buf = _SCRATCH[name]
+    if buf is None or buf.size < size:
+        buf = _SCRATCH[name] = numpy.empty(size, dtype=numpy.float32)
+    return buf[:size]
+
+
+_DEBUG = False
+
+
+def debug_print(*msgs):
+    if _DEBUG:
         print("   ", *msgs)
-        return
 
-    if obj.type == None:
+
+def remove_unused_shape_keys(obj):
+    if obj.type is None:
         raise BaseException("Expected a mesh object, got: None")
     if obj.type != "MESH":
         raise BaseException("Expected a mesh object, got: " + obj.type)
@@ -23,39 +41,47 @@ def remove_unused_shape_keys(obj):
     kbs = obj.data.shape_keys.key_blocks
     nverts = len(obj.data.vertices)
     to_delete = []
-    cache = {}
 
-    # Create an array to store the vertex locations
-    locs = numpy.empty(3 * nverts, dtype=numpy.float32)
+    # Views into the shared scratch sized for this mesh; reused for every
+    # shape key, since keys are almost always relative to the same key
+    # ("Basis")
+    locs = _scratch("locs", 3 * nverts)
+    rel_locs = _scratch("rel_locs", 3 * nverts)
+    rel_name = None
 
     # Loop through all the shape keys for the mesh
     for kb in kbs:
-        # Skip self
-        if kb == kb.relative_key:
+        rel_key = kb.relative_key
+
+        # Skip self (and keys with no relative key at all). Compared by
+        # name: == on RNA wrappers goes through their __eq__ crossing
+        if rel_key is None or kb.name == rel_key.name:
             continue
 
         # Get the vertex locations for this shape key
         kb.data.foreach_get("co", locs)
 
-        # If we haven't already cached the relative key for this shape key,
-        # get the vertex locations for the relative key and cache them
-        if kb.relative_key.name not in cache:
-            rel_locs = numpy.empty(3 * nverts, dtype=numpy.float32)
-            kb.relative_key.data.foreach_get("co", rel_locs)
-            cache[kb.relative_key.name] = rel_locs
-
-        # Get the cached relative key vertex locations
-        rel_locs = cache[kb.relative_key.name]
-
-        # Calculate the largest distance between the relative key and the shape key
-        distances = numpy.abs(locs - rel_locs)
-        largestDistance = numpy.amax(distances)
-
-        # Print the largest distance
-        # debug_print("Largest distance for", kb.name, "is", largestDistance)
+        # Refetch the relative key locations only when the relative key
+        # changed since the previous shape key
+        if rel_key.name != rel_name:
+            rel_key.data.foreach_get("co", rel_locs)
+            rel_name = rel_key.name
+
+        # Scan the delta in chunks and stop at the first one out of
+        # tolerance. Non-trivial keys (the common case) usually fail in the
+        # first chunk, so most of the mesh is never subtracted, and no
+        # full-size bool temporary is built either way.
+        unused = True
+        for start in range(0, 3 * nverts, _CHUNK):
+            chunk = locs[start : start + _CHUNK]
+            numpy.subtract(chunk, rel_locs[start : start + _CHUNK], out=chunk)
+            numpy.abs(chunk, out=chunk)
+            if SHAPE_KEY_TOLERANCE <= chunk.max():
+                unused = False
+                break
 
         # Check if all the vertex locations are within the tolerance
-        if (distances < SHAPE_KEY_TOLERANCE).all():
+        if unused:
             # If so, add this shape key to the list to delete
             # Only if it's not a Face VRC* kb though.
             if not is_vrc_face_workaround(obj, kb.name):
@@ -1,14 +1,23 @@
 
 import re
+
+import numpy
+
 from ..consts import VERTEX_GROUP_TOLERANCE
 
+# Matches a trailing .R/.L side tag with an optional numeric suffix
+_RE_SIDE_TAG = re.compile(r'((.R|.L)(.(\d){1,}){0,1})(?!.)')
 
-def remove_unused_vertex_groups(obj):
-    def debug_print(*msgs):
+_DEBUG = False
+
+
+def debug_print(*msgs):
+    if _DEBUG:
         print("   ", *msgs)
-        return
 
-    if obj.type == None:
+
+def remove_unused_vertex_groups(obj):
+    if obj.type is None:
         raise BaseException("Expected a mesh object, got: None")
     if obj.type != "MESH":
         raise BaseException("Expected a mesh object, got: " + obj.type)
@@ -18,26 +27,43 @@ def remove_unused_vertex_groups(obj):
     # Dictionary to track usage of vertex groups
     vgroup_used = {i: False for i, vg in enumerate(obj.vertex_groups)}
     vgroup_names = {i: vg.name for i, vg in enumerate(obj.vertex_groups)}
+    name_to_idx = {name: i for i, name in vgroup_names.items()}
 
-    # Determine usage of vertex groups
+    # Determine usage of vertex groups. The deform weights are collected in
+    # one bare pass with no per-weight branching; the tolerance filter and
+    # dedup then run in numpy over flat primitive arrays.
+    indices = []
+    weights = []
     for v in obj.data.vertices:
         for g in v.groups:
-            if VERTEX_GROUP_TOLERANCE < g.weight:
-                vgroup_used[g.group] = True
-                # Mirror vertex group handling
-                armatch = re.search(r'((.R|.L)(.(\d){1,}){0,1})(?!.)', vgroup_names[g.group])
-                if armatch:
-                    tag = armatch.group()
-                    mirror_tag = tag.replace(".R", ".L") if ".R" in tag else tag.replace(".L", ".R")
-                    mirror_vgname = vgroup_names[g.group].replace(tag, mirror_tag)
-                    # Ensure mirror group is marked used
-                    for idx, name in vgroup_names.items():
-                        if mirror_vgname == name:
-                            vgroup_used[idx] = True
-                            break
-
-    # Remove unused vertex groups by iterating over indices in reverse order
-    for idx in sorted(vgroup_used.keys(), reverse=True):
-        if not vgroup_used[idx]:
-            print(f"Removing vertex group:  {obj.name} -> {vgroup_names[idx]}")
-            obj.vertex_groups.remove(obj.vertex_groups[idx])
+            indices.append(g.group)
+            weights.append(g.weight)
+
+    if indices:
+        indices = numpy.fromiter(indices, dtype=numpy.intp, count=len(indices))
+        weights = numpy.fromiter(weights, dtype=numpy.single, count=len(weights))
+        for idx in numpy.unique(indices[VERTEX_GROUP_TOLERANCE < weights]):
+            vgroup_used[int(idx)] = True
+
+    # Mirror vertex group handling — once per used group rather than once
+    # per weighted vertex
+    for idx in [i for i, used in vgroup_used.items() if used]:
+        armatch = _RE_SIDE_TAG.search(vgroup_names[idx])
+        if armatch:
+            tag = armatch.group()
+            mirror_tag = tag.replace(".R", ".L") if ".R" in tag else tag.replace(".L", ".R")
+            mirror_vgname = vgroup_names[idx].replace(tag, mirror_tag)
+            # Ensure mirror group is marked used
+            mirror_idx = name_to_idx.get(mirror_vgname)
+            if mirror_idx is not None:
+                vgroup_used[mirror_idx] = True
+
+    # Capture the group objects before removing anything — each remove
+    # shifts the collection's indices, but the references stay valid, so
+    # one pass suffices and no index bookkeeping is needed
+    to_remove = [
+        obj.vertex_groups[idx] for idx, used in vgroup_used.items() if not used
+    ]
+    for vgroup in to_remove:
+        print(f"Removing vertex group:  {obj.name} -> {vgroup.name}")
+        obj.vertex_groups.remove(vgroup)
@@ -136,7 +136,7 @@ class NyaaPanel(bpy.types.Panel):
 
         layout = self.layout
 
-        if error != None:
+        if error is not None:
             box = layout.box()
             box.label(text="An error occurred.")
             box.label(text="Please report the issue.")
@@ -35,7 +35,7 @@ class NyaaSelectStandardBones(bpy.types.Operator):
 
 
 def perform_select_standard_bones(armature, include_breast_bones=True):
-    if armature == None or armature.type != "ARMATURE":
+    if armature is None or armature.type != "ARMATURE":
         raise Exception("Expected an armature")
 
     currentMode = bpy.context.mode
@@ -34,14 +34,14 @@ class NyaaToolsAddModifier(bpy.types.Operator):
 
 def perform_add_modifier(meshes, which_modifier):
     def move_modifier_to_top(modifier):
-        for i in range(len(modifier.id_data.modifiers)):
-            if modifier == modifier.id_data.modifiers[0]:
-                break
-            bpy.ops.object.modifier_move_up(modifier=modifier.name)
+        # One operator call instead of one modifier_move_up per position,
+        # each of which re-sorted the stack and tagged the depsgraph
+        if modifier != modifier.id_data.modifiers[0]:
+            bpy.ops.object.modifier_move_to_index(modifier=modifier.name, index=0)
 
     def search_for_avatar_armature(mesh):
         key = get_prop(mesh, PROP_AVATAR_LAYERS)
-        if key != None:
+        if key is not None:
             keySplit = key.split(",") if key != "" else []
             for path in keySplit:
                 pathParts = path.split("/") if path != "" else []
@@ -54,7 +54,7 @@ def perform_add_modifier(meshes, which_modifier):
         ret = None
         for obj in bpy.data.objects:
             if obj.type == "ARMATURE":
-                if ret != None:
+                if ret is not None:
                     return None
                 ret = obj
         return ret
@@ -62,7 +62,8 @@ def perform_add_modifier(meshes, which_modifier):
     if len(meshes) == 0:
         raise Exception("Please select at least 1 mesh object!")
 
-    bpy.ops.object.mode_set(mode="OBJECT")
+    if bpy.context.mode != "OBJECT":
+        bpy.ops.object.mode_set(mode="OBJECT")
 
     if which_modifier == "Armature":
         for mesh in meshes:
@@ -76,9 +77,9 @@ def perform_add_modifier(meshes, which_modifier):
             mod = mesh.modifiers.new(name, "ARMATURE")
             move_modifier_to_top(mod)
             mod.object = search_for_avatar_armature(mesh)
-            if mod.object == None:
+            if mod.object is None:
                 mod.object = search_for_only_armature()
-            mod.show_expanded = mod.object == None
+            mod.show_expanded = mod.object is None
             mod.show_on_cage = True
             mod.show_in_editmode = True
             mod.show_viewport = True
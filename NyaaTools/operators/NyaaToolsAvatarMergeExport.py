@@ -20,6 +20,13 @@ from ..avatar.merge_onto_avatar_layer import merge_onto_avatar_layer
 
 TEMP_SCENE_NAME = "Temp Merge & Export"
 
+_DEBUG = False
+
+
+def debug_print(*msgs):
+    if _DEBUG:
+        print("   ", *msgs)
+
 
 class NyaaToolsAvatarMergeExport(bpy.types.Operator):
     """Merge and export the avatar. If you have an export path defined, it will export there"""
@@ -65,11 +72,8 @@ class NyaaToolsAvatarMergeExport(bpy.types.Operator):
 
 
 def perform_merge_export(avatar_name):
-    def debug_print(*msgs):
-        print("   ", *msgs)
-        return
-
-    bpy.ops.object.mode_set(mode="OBJECT")
+    if bpy.context.mode != "OBJECT":
+        bpy.ops.object.mode_set(mode="OBJECT")
 
     bpy.ops.outliner.orphans_purge(do_recursive=True)
     
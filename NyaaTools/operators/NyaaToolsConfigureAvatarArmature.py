@@ -41,7 +41,7 @@ class NyaaToolsConfigureAvatarArmature(bpy.types.Operator):
 
 
 def perform_configure_avatar_armature(armature, avatar_name, export_path):
-    if armature == None or armature.type != "ARMATURE":
+    if armature is None or armature.type != "ARMATURE":
         raise Exception("Expected an armature")
 
     # TODO: Check if avatar name already exists. Error if it does
@@ -46,7 +46,7 @@ def perform_add_meshes_to_avatar(armature, meshes, layer_name):
     if not isinstance(meshes, list) or len(meshes) == 0:
         raise Exception("Expected at least one mesh")
 
-    if armature == None or armature.type != "ARMATURE":
+    if armature is None or armature.type != "ARMATURE":
         raise Exception("Expected an armature")
 
     avatar_name = get_prop(armature, PROP_AVATAR_NAME)
@@ -77,7 +77,7 @@ def contiguous_check(selected_bones):
 
 def perform_dissolve_bones():
     obj = bpy.context.view_layer.objects.active
-    if obj == None or obj.type != "ARMATURE":
+    if obj is None or obj.type != "ARMATURE":
         raise Exception("Expected an armature")
 
     if bpy.context.mode != "EDIT_ARMATURE":
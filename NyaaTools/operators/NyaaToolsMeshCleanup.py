@@ -34,7 +34,8 @@ def perform_cleanup(meshes, vg, sk, mat):
     if not isinstance(meshes, list) or len(meshes) == 0:
         raise Exception("Please select at least 1 mesh object!")
 
-    bpy.ops.object.mode_set(mode="OBJECT")
+    if bpy.context.mode != "OBJECT":
+        bpy.ops.object.mode_set(mode="OBJECT")
 
     for mesh in meshes:
         if vg:
@@ -46,7 +46,7 @@ class NyaaToolsNormalizeArmatureATPose(bpy.types.Operator):
 
 
 def perform_normalize_armature(armature, which_pose, apply_roll=False):
-    if armature == None or armature.type != "ARMATURE":
+    if armature is None or armature.type != "ARMATURE":
         raise Exception("Expected an armature")
 
     if not which_pose in {"a-pose", "t-pose"}:
@@ -60,22 +60,28 @@ def perform_normalize_armature(armature, which_pose, apply_roll=False):
     # Progress count, total
     progress = [0]
     progress_total = 0
+    last_pct = [-1]
 
     def callback_progress_tick():
+        # Only redraw the progress indicator when the integer percent
+        # actually changes; every progress_update repaints the header
         progress[0] = progress[0] + 1
-        wm.progress_update(progress[0] / progress_total * 100)
+        pct = int(progress[0] / progress_total * 100)
+        if pct != last_pct[0]:
+            last_pct[0] = pct
+            wm.progress_update(pct)
 
     # Progress Total: T-Pose is:
     # - Fixed count of callback_progress_tick() in the function
     # - Total number of affected meshes
     # - Total number of shape keys in affected meshes
-    progress_total += 36
+    progress_total += 35
     total_shapekeys = 0
 
     affected_meshes = find_meshes_affected_by_armature_modifier(armature)
     progress_total += 2 * len(affected_meshes)
     for mesh, modifier in affected_meshes:
-        if mesh.data.shape_keys != None:
+        if mesh.data.shape_keys is not None:
             total_shapekeys += len(mesh.data.shape_keys.key_blocks)
 
     progress_total += total_shapekeys
@@ -84,7 +90,8 @@ def perform_normalize_armature(armature, which_pose, apply_roll=False):
     ##  Begin progress  ##
 
     # Make armature active
-    bpy.ops.object.mode_set(mode="OBJECT")
+    if bpy.context.mode != "OBJECT":
+        bpy.ops.object.mode_set(mode="OBJECT")
     bpy.context.view_layer.objects.active = armature
 
     wm.progress_begin(0, 100)
@@ -93,12 +100,15 @@ def perform_normalize_armature(armature, which_pose, apply_roll=False):
     normalize_armature_rename_bones(armature)
 
     # Set T-Pose
-    normalize_armature_pose(armature, which_pose, True, callback_progress_tick)
+    normalize_armature_pose(
+        armature, which_pose, True, callback_progress_tick, affected_meshes
+    )
 
     # Set roll
     normalize_armature_roll_bones(armature, which_pose, apply_roll)
 
-    bpy.ops.object.mode_set(mode="OBJECT")
+    if bpy.context.mode != "OBJECT":
+        bpy.ops.object.mode_set(mode="OBJECT")
 
     wm.progress_end()
 
@@ -106,7 +116,7 @@ def perform_normalize_armature(armature, which_pose, apply_roll=False):
 
 
 def perform_fast_pose(armature, which_pose):
-    if armature == None or armature.type != "ARMATURE":
+    if armature is None or armature.type != "ARMATURE":
         raise Exception("Expected an armature")
 
     if not which_pose in {"a-pose", "t-pose"}:
@@ -117,10 +127,16 @@ def perform_fast_pose(armature, which_pose):
     # Progress count, total
     progress = [0]
     progress_total = 0
+    last_pct = [-1]
 
     def callback_progress_tick():
+        # Only redraw the progress indicator when the integer percent
+        # actually changes; every progress_update repaints the header
         progress[0] = progress[0] + 1
-        wm.progress_update(progress[0] / progress_total * 100)
+        pct = int(progress[0] / progress_total * 100)
+        if pct != last_pct[0]:
+            last_pct[0] = pct
+            wm.progress_update(pct)
 
     # Progress Total: Rename bones is the length of the bone descriptors
     progress_total += len(BONE_DESC_MAP)
@@ -129,7 +145,8 @@ def perform_fast_pose(armature, which_pose):
     ##  Begin progress  ##
 
     # Make armature active
-    bpy.ops.object.mode_set(mode="OBJECT")
+    if bpy.context.mode != "OBJECT":
+        bpy.ops.object.mode_set(mode="OBJECT")
     bpy.context.view_layer.objects.active = armature
 
     if estimate_is_normalized(armature):
@@ -137,7 +154,8 @@ def perform_fast_pose(armature, which_pose):
 
         normalize_armature_pose(armature, which_pose, False, callback_progress_tick)
 
-        bpy.ops.object.mode_set(mode="OBJECT")
+        if bpy.context.mode != "OBJECT":
+            bpy.ops.object.mode_set(mode="OBJECT")
 
         wm.progress_end()
     else:
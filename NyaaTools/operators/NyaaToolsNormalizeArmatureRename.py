@@ -26,20 +26,22 @@ class NyaaToolsNormalizeArmatureRename(bpy.types.Operator):
 
 
 def perform_normalize_rename(armature):
-    if armature == None or armature.type != "ARMATURE":
+    if armature is None or armature.type != "ARMATURE":
         raise Exception("Expected an armature")
 
     ######################
     ##  Begin progress  ##
 
     # Make armature active
-    bpy.ops.object.mode_set(mode="OBJECT")
+    if bpy.context.mode != "OBJECT":
+        bpy.ops.object.mode_set(mode="OBJECT")
     bpy.context.view_layer.objects.active = armature
 
     # Rename bones
     normalize_armature_rename_bones(armature, False)
 
-    bpy.ops.object.mode_set(mode="OBJECT")
+    if bpy.context.mode != "OBJECT":
+        bpy.ops.object.mode_set(mode="OBJECT")
 
 
     print("Done!")
@@ -42,13 +42,15 @@ def perform_normalize_retarget(animation_name: str):
 	if not extra_armature:
 		raise Exception("Please select an extra armature")
 
-	bpy.ops.object.mode_set(mode="OBJECT")
+	if bpy.context.mode != "OBJECT":
+		bpy.ops.object.mode_set(mode="OBJECT")
 	bpy.context.view_layer.objects.active = target_armature
 
 	# Retarget armature
 	normalize_armature_retarget(target_armature, extra_armature, animation_name)
 
-	bpy.ops.object.mode_set(mode="OBJECT")
+	if bpy.context.mode != "OBJECT":
+		bpy.ops.object.mode_set(mode="OBJECT")
 
 	print("Done!")
 
@@ -34,7 +34,7 @@ def perform_remove_meshes_from_avatar(armature, meshes):
     if not isinstance(meshes, list) or len(meshes) == 0:
         raise Exception("Expected at least one mesh")
 
-    if armature == None or armature.type != "ARMATURE":
+    if armature is None or armature.type != "ARMATURE":
         raise Exception("Expected an armature")
 
     avatar_name = get_prop(armature, PROP_AVATAR_NAME)
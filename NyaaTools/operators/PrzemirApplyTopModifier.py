@@ -44,13 +44,14 @@ def perform_apply_top_modifier(meshes):
     # - Total number of shape keys in all meshes
     progress_total += len(meshes)
     for mesh in meshes:
-        if mesh.data.shape_keys != None:
+        if mesh.data.shape_keys is not None:
             progress_total += len(mesh.data.shape_keys.key_blocks)
 
     ######################
     ##  Begin progress  ##
 
-    bpy.ops.object.mode_set(mode="OBJECT")
+    if bpy.context.mode != "OBJECT":
+        bpy.ops.object.mode_set(mode="OBJECT")
 
     wm.progress_begin(0, 100)
 